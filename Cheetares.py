@@ -1,13 +1,2432 @@
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QToolBar, QLineEdit, QPushButton, QAction
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QUrl, QSize, Qt, QObject, pyqtSlot
-from PyQt5.QtGui import QIcon, QFont, QPixmap
+import time
+import queue
+import sqlite3
+import threading
+import re
+import bisect
+import heapq
+import glob
+import pickle
+import collections
+import json
+import string
+import html
+import base64
+import urllib.request
+import urllib.error
+import concurrent.futures
+import hashlib
+import zlib
+import mmap
+import array
+from cheetares_launch import (looks_like_address, address_url, parse_args, instance_server_name,
+                              send_to_running_instance, InstanceServer, launch_or_forward)
+
+if __name__ == "__main__":
+    # İkinci açılış adresleri çalışan tarayıcıya QtWebEngine yüklenmeden devreder; Chromium'u
+    # başlatmak saniyeler sürebilir ve devreden süreç için boşa gider
+    LAUNCH = launch_or_forward(sys.argv[1:])
+
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QToolBar, QLineEdit, QPushButton, QAction,
+                             QTabWidget, QMessageBox, QCompleter, QDockWidget, QTableWidget, QTableWidgetItem,
+                             QWidget, QVBoxLayout, QHBoxLayout, QHeaderView, QAbstractItemView, QFileDialog)
+from PyQt5.QtWebEngineWidgets import (QWebEngineView, QWebEnginePage, QWebEngineProfile, QWebEngineScript,
+                                      QWebEngineDownloadItem)
+from PyQt5.QtWebEngineCore import (QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo,
+                                    QWebEngineUrlScheme, QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob)
+from PyQt5.QtCore import (QUrl, QSize, Qt, QObject, QTimer, QStringListModel, QBuffer, QFile, QIODevice,
+                          QByteArray, QDataStream, QPointF, QUrlQuery, QDateTime,
+                          pyqtSlot, pyqtSignal)
+from PyQt5.QtGui import QIcon, QFont, QPixmap, QKeySequence, QPalette, QColor
 from PyQt5.QtWebChannel import QWebChannel
 
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Tarayıcının kendi sayfaları için dahili şema; ana sayfa cheetares://home adresinden sunulur
+INTERNAL_SCHEME = b"cheetares"
+HOME_URL = QUrl("cheetares://home")
+
+# Ana sayfadaki (index.html) hızlı erişim linkleri
+QUICK_LINKS = [
+    ("YouTube", "https://www.youtube.com"),
+    ("GitHub", "https://www.github.com"),
+    ("Wikipedia", "https://www.wikipedia.org"),
+]
+
+
+def _process_rss_kb(pid):
+    # Verilen sürecin bellekte kapladığı alanı (RSS) KB olarak döndürür.
+    # Linux'ta /proc okunur, diğer sistemlerde psutil varsa o kullanılır.
+    if not pid:
+        return None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss // 1024
+    except Exception:
+        return None
+
+
+def _process_type(pid, root_pid):
+    # Chromium alt süreçleri türünü --type= argümanıyla alır (renderer, gpu-process, utility, zygote)
+    if pid == root_pid:
+        return "browser"
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            arguments = f.read().split(b"\0")
+    except OSError:
+        try:
+            import psutil
+            arguments = [argument.encode() for argument in psutil.Process(pid).cmdline()]
+        except Exception:
+            return "?"
+    for argument in arguments:
+        if argument.startswith(b"--type="):
+            return argument[len(b"--type="):].decode(errors="replace")
+    return "other"
+
+
+def process_tree(root_pid=None):
+    # Tarayıcı süreci ve altındaki tüm süreçler (QtWebEngineProcess): [(pid, tür, RSS KB)].
+    # Linux'ta /proc taranır, diğer sistemlerde psutil varsa o kullanılır.
+    root_pid = root_pid or os.getpid()
+    try:
+        children = collections.defaultdict(list)
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # Süreç adı boşluk ve parantez içerebilir; ppid son ')' işaretinden sonraki ikinci alandır
+            children[int(stat.rsplit(")", 1)[1].split()[1])].append(int(entry))
+        pids = [root_pid]
+        for pid in pids:
+            pids.extend(children.get(pid, ()))
+    except OSError:
+        try:
+            import psutil
+            pids = [root_pid] + [p.pid for p in psutil.Process(root_pid).children(recursive=True)]
+        except Exception:
+            pids = [root_pid]
+    return [(pid, _process_type(pid, root_pid), _process_rss_kb(pid)) for pid in pids]
+
+
+def process_summary(rows):
+    # Türe göre süreç sayısı ve toplam RSS; paylaşılan sayfalar her süreçte ayrı sayıldığı için üst sınırdır
+    counts = collections.Counter(kind for _, kind, _ in rows)
+    return counts, sum(rss or 0 for _, _, rss in rows)
+
+
+def _internal_page(title, body):
+    # cheetares:// rapor sayfalarının ortak iskeleti ve tablo stili; InternalSchemeHandler yanıtı döner
+    page = f"""<!DOCTYPE html>
+<html lang="tr"><head><meta charset="UTF-8"><title>Cheetares - {html.escape(title)}</title>
+<style>
+body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 30px; color: #333; }}
+table {{ border-collapse: collapse; margin-bottom: 30px; width: 100%; font-size: 13px; }}
+th, td {{ border-bottom: 1px solid #e0e0e0; padding: 6px 8px; text-align: left; }}
+th {{ background: #f0f2f5; }}
+</style></head><body>
+{body}
+</body></html>"""
+    return b"text/html", page.encode("utf-8")
+
+
+def render_process_page(url):
+    # cheetares://processes sayfası: kiosk makinelerini boyutlandırmak için süreç modeli raporu
+    rows = process_tree()
+    counts, total_kb = process_summary(rows)
+    process_rows = "".join(
+        f"<tr><td>{pid}</td><td>{html.escape(kind)}</td><td>{'-' if rss is None else f'{rss / 1024:.1f}'}</td></tr>"
+        for pid, kind, rss in sorted(rows, key=lambda row: -(row[2] or 0)))
+    count_text = ", ".join(f"{kind}: {count}" for kind, count in counts.most_common())
+    flags = html.escape(os.environ.get("QTWEBENGINE_CHROMIUM_FLAGS", "") or "-")
+    return _internal_page("Süreçler", f"""<h1>Süreçler</h1>
+<p>{len(rows)} süreç ({html.escape(count_text)}), toplam RSS: {total_kb / 1024:.1f} MB</p>
+<p>Chromium bayrakları: <code>{flags}</code></p>
+<table><tr><th>PID</th><th>tür</th><th>RSS (MB)</th></tr>{process_rows}</table>""")
+
+
+def chromium_flags(args):
+    flags = []
+    if args.process_model == "process-per-site":
+        flags.append("--process-per-site")
+    if args.renderer_process_limit > 0:
+        flags.append(f"--renderer-process-limit={args.renderer_process_limit}")
+    if args.js_heap_size > 0:
+        flags.append(f"--js-flags=--max-old-space-size={args.js_heap_size}")
+    if args.disable_gpu:
+        flags.append("--disable-gpu")
+    flags.extend(args.chromium_flag)
+    return flags
+
+
+def apply_chromium_flags(args):
+    # QtWebEngine bayrakları Chromium başlatılırken bir kez okur, bu yüzden QApplication'dan önce
+    # çağrılmalı. Ortamda zaten verilmiş bayraklar korunur.
+    flags = chromium_flags(args)
+    if not flags:
+        return
+    existing = os.environ.get("QTWEBENGINE_CHROMIUM_FLAGS", "").strip()
+    os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = " ".join(([existing] if existing else []) + flags)
+    print(f"Chromium bayrakları: {os.environ['QTWEBENGINE_CHROMIUM_FLAGS']}")
+
+
+def create_profile(args, parent=None):
+    # Adı olan profil kalıcıdır: çerezler, yerel depolama ve HTTP önbelleği yeniden başlatmalarda korunur.
+    # Sayfalar profilden önce silinmemeli, bu yüzden profil uygulama nesnesine bağlanır.
+    profile = QWebEngineProfile(args.profile, parent or QApplication.instance())
+
+    if args.cache_type == "memory":
+        profile.setHttpCacheType(QWebEngineProfile.MemoryHttpCache)
+    else:
+        profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+        if args.cache_dir:
+            os.makedirs(args.cache_dir, exist_ok=True)
+            profile.setCachePath(os.path.abspath(args.cache_dir))
+    profile.setHttpCacheMaximumSize(max(args.cache_size, 0) * 1024 * 1024)
+
+    cookie_policies = {
+        "none": QWebEngineProfile.NoPersistentCookies,
+        "allow": QWebEngineProfile.AllowPersistentCookies,
+        "force": QWebEngineProfile.ForcePersistentCookies,
+    }
+    profile.setPersistentCookiesPolicy(cookie_policies[args.cookies])
+
+    if args.clear_cache:
+        profile.clearHttpCache()
+
+    profile.installUrlSchemeHandler(INTERNAL_SCHEME, InternalSchemeHandler(profile))
+
+    print(f"Profil: {profile.storageName()} (önbellek: {args.cache_type}, {profile.cachePath()})")
+    return profile
+
+
+class HistoryStore:
+    # Ziyaret geçmişi SQLite'ta tutulur. Yazmalar bir kuyruğa atılır ve arka plandaki
+    # iş parçacığı tarafından toplu (tek transaction) yazılır, böylece arayüz iş parçacığı
+    # disk G/Ç'sini hiç beklemez. Ham ziyaretlerin yanında URL başına (pages) ve host başına
+    # (hosts) ziyaret sayısı ve son ziyaret zamanı yazarken güncellenir; okumalar ziyaretleri
+    # gruplamak yerine bu tablolardan indeksle yapılır. Başlık ve URL'ler FTS5 ile indekslenir.
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS visits (
+            id INTEGER PRIMARY KEY,
+            url TEXT NOT NULL,
+            title TEXT NOT NULL DEFAULT '',
+            host TEXT NOT NULL DEFAULT '',
+            visit_time REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS visits_url ON visits(url);
+        CREATE INDEX IF NOT EXISTS visits_time ON visits(visit_time);
+        CREATE TABLE IF NOT EXISTS pages (
+            id INTEGER PRIMARY KEY,
+            url TEXT NOT NULL UNIQUE,
+            title TEXT NOT NULL DEFAULT '',
+            host TEXT NOT NULL DEFAULT '',
+            visit_count INTEGER NOT NULL DEFAULT 0,
+            last_visit REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS pages_last_visit ON pages(last_visit);
+        CREATE TABLE IF NOT EXISTS hosts (
+            host TEXT PRIMARY KEY,
+            visit_count INTEGER NOT NULL,
+            last_visit REAL NOT NULL
+        ) WITHOUT ROWID;
+        CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+            title, url, content='pages', content_rowid='id', tokenize='unicode61'
+        );
+        CREATE TRIGGER IF NOT EXISTS pages_ai AFTER INSERT ON pages BEGIN
+            INSERT INTO pages_fts(rowid, title, url) VALUES (new.id, new.title, new.url);
+        END;
+        CREATE TRIGGER IF NOT EXISTS pages_ad AFTER DELETE ON pages BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, url) VALUES ('delete', old.id, old.title, old.url);
+        END;
+        CREATE TRIGGER IF NOT EXISTS pages_au AFTER UPDATE OF title ON pages WHEN old.title != new.title BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, url) VALUES ('delete', old.id, old.title, old.url);
+            INSERT INTO pages_fts(rowid, title, url) VALUES (new.id, new.title, new.url);
+        END;
+        -- Eski sürümün ziyaret başına FTS indeksi
+        DROP TRIGGER IF EXISTS visits_ai;
+        DROP TRIGGER IF EXISTS visits_ad;
+        DROP TRIGGER IF EXISTS visits_au;
+        DROP TABLE IF EXISTS visits_fts;
+        DROP INDEX IF EXISTS visits_host;
+    """
+
+    def __init__(self, path, max_age_days=90, flush_interval=1.0, batch_size=200,
+                 expire_interval=6 * 60 * 60):
+        self.path = path
+        self.max_age_days = max_age_days
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.expire_interval = expire_interval
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        connection = self._connect()
+        connection.executescript(self.SCHEMA)
+        self._migrate(connection)
+        connection.close()
+
+        # Okumalar (arama) çağıran iş parçacığının kendi bağlantısıyla yapılır; WAL modu
+        # sayesinde yazıcı iş parçacığı çalışırken de okunabilir.
+        self._readers = threading.local()
+        self._read_connections = []
+        self._read_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="HistoryWriter", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=10)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @staticmethod
+    def _migrate(connection):
+        # Eski sürümden kalan geçmişte sadece ziyaretler var; özet tablolar bir kez doldurulur
+        if connection.execute("SELECT 1 FROM pages LIMIT 1").fetchone():
+            return
+        if not connection.execute("SELECT 1 FROM visits LIMIT 1").fetchone():
+            return
+        with connection:
+            # MAX ile seçilen diğer sütunlar (başlık, host) SQLite'ta en son ziyaretin satırından gelir
+            connection.execute(
+                "INSERT INTO pages(url, title, host, visit_count, last_visit) "
+                "SELECT url, title, host, COUNT(*), MAX(visit_time) FROM visits GROUP BY url")
+            HistoryStore._rebuild_hosts(connection)
+
+    @staticmethod
+    def _rebuild_hosts(connection):
+        connection.execute("DELETE FROM hosts")
+        connection.execute(
+            "INSERT INTO hosts(host, visit_count, last_visit) "
+            "SELECT host, SUM(visit_count), MAX(last_visit) FROM pages WHERE host != '' GROUP BY host")
+
+    def add_visit(self, url, title="", host="", visit_time=None):
+        self._queue.put(("visit", url, title, host, visit_time or time.time()))
+
+    def update_title(self, url, title):
+        self._queue.put(("title", url, title))
+
+    def close(self):
+        # Kuyrukta bekleyen tüm yazmalar bitene kadar bekler
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        with self._read_lock:
+            for connection in self._read_connections:
+                connection.close()
+            self._read_connections = []
+        self._readers = threading.local()
+
+    def _writer_loop(self):
+        connection = self._connect()
+        last_expire = 0
+        running = True
+        while running:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = False
+            # İlk öğeden sonra kuyrukta ne varsa (en fazla batch_size) aynı transaction'a al
+            while item is not False:
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = False
+
+            if batch:
+                try:
+                    self._write_batch(connection, batch)
+                except sqlite3.Error as e:
+                    print(f"Geçmiş kaydedilemedi: {e}")
+
+            if running and time.time() - last_expire >= self.expire_interval:
+                last_expire = time.time()
+                try:
+                    self._expire(connection)
+                except sqlite3.Error as e:
+                    print(f"Eski geçmiş temizlenemedi: {e}")
+        connection.close()
+
+    def _write_batch(self, connection, batch):
+        with connection:
+            for item in batch:
+                if item[0] == "visit":
+                    _, url, title, host, visit_time = item
+                    connection.execute(
+                        "INSERT INTO visits(url, title, host, visit_time) VALUES (?, ?, ?, ?)",
+                        (url, title, host, visit_time))
+                    connection.execute(
+                        "INSERT INTO pages(url, title, host, visit_count, last_visit) VALUES (?, ?, ?, 1, ?) "
+                        "ON CONFLICT(url) DO UPDATE SET visit_count = visit_count + 1, "
+                        "last_visit = MAX(last_visit, excluded.last_visit), host = excluded.host, "
+                        "title = CASE WHEN excluded.title != '' THEN excluded.title ELSE title END",
+                        (url, title, host, visit_time))
+                    if host:
+                        connection.execute(
+                            "INSERT INTO hosts(host, visit_count, last_visit) VALUES (?, 1, ?) "
+                            "ON CONFLICT(host) DO UPDATE SET visit_count = visit_count + 1, "
+                            "last_visit = MAX(last_visit, excluded.last_visit)",
+                            (host, visit_time))
+                else:
+                    _, url, title = item
+                    connection.execute(
+                        "UPDATE visits SET title = ? WHERE id = "
+                        "(SELECT id FROM visits WHERE url = ? ORDER BY visit_time DESC LIMIT 1)",
+                        (title, url))
+                    connection.execute("UPDATE pages SET title = ? WHERE url = ?", (title, url))
+
+    def _expire(self, connection):
+        cutoff = time.time() - self.max_age_days * 24 * 60 * 60
+        with connection:
+            expired = connection.execute(
+                "SELECT url, COUNT(*) FROM visits WHERE visit_time < ? GROUP BY url", (cutoff,)).fetchall()
+            deleted = connection.execute("DELETE FROM visits WHERE visit_time < ?", (cutoff,)).rowcount
+            if expired:
+                # Özet tablolar silinen ziyaretlere göre düzeltilir
+                connection.executemany("UPDATE pages SET visit_count = visit_count - ? WHERE url = ?",
+                                       [(count, url) for url, count in expired])
+                connection.execute("DELETE FROM pages WHERE visit_count <= 0")
+                self._rebuild_hosts(connection)
+        if deleted:
+            # Silinen satırların yerini geri kazanmak için FTS indeksini birleştir ve veritabanını küçült
+            with connection:
+                connection.execute("INSERT INTO pages_fts(pages_fts) VALUES ('optimize')")
+            connection.execute("VACUUM")
+            print(f"Geçmişten {deleted} eski ziyaret silindi.")
+
+    def _reader(self):
+        # Her okuyan iş parçacığının (arayüz, öneri havuzu) kendi bağlantısı olur; close() hepsini kapatır
+        connection = getattr(self._readers, "connection", None)
+        if connection is None:
+            connection = self._readers.connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            with self._read_lock:
+                self._read_connections.append(connection)
+        return connection
+
+    @staticmethod
+    def _match_expression(text):
+        # Kullanıcı metnini FTS5 sorgusuna çevirir: her kelime ön ek (prefix) araması olur
+        terms = [term.replace('"', '""') for term in text.split()]
+        return " ".join(f'"{term}"*' for term in terms if term)
+
+    def search(self, text, limit=20):
+        # URL ve başlıkta tam metin arama. Her URL bir kez, en son ziyarete göre sıralı döner.
+        expression = self._match_expression(text)
+        if not expression:
+            return []
+        rows = self._reader().execute(
+            "SELECT p.url, p.title, p.last_visit, p.visit_count "
+            "FROM pages_fts JOIN pages p ON p.id = pages_fts.rowid "
+            "WHERE pages_fts MATCH ? ORDER BY p.last_visit DESC LIMIT ?",
+            (expression, limit)).fetchall()
+        return rows
+
+    def host_stats(self):
+        # Adres çubuğu tamamlaması için: host başına ziyaret sayısı ve son ziyaret zamanı
+        return self._reader().execute("SELECT host, visit_count, last_visit FROM hosts").fetchall()
+
+    def visit_count(self, url):
+        row = self._reader().execute("SELECT visit_count FROM pages WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else 0
+
+    def recent(self, limit=50):
+        return self._reader().execute(
+            "SELECT url, title, last_visit, visit_count FROM pages ORDER BY last_visit DESC LIMIT ?",
+            (limit,)).fetchall()
+
+
+class CompletionIndex:
+    # Adres çubuğu için bellekte tutulan ön ek (prefix) indeksi. Anahtarlar sıralı bir
+    # listede tutulur, her tuş vuruşunda bisect ile eşleşen aralık bulunur ve frecency
+    # (sıklık + yakınlık) puanına göre en iyi sonuçlar döndürülür.
+    SOURCE_BONUS = {"history": 0, "bookmark": 200, "quicklink": 100}
+
+    def __init__(self):
+        self.keys = []
+        self.entries = {}
+
+    @staticmethod
+    def _normalize(host):
+        host = host.lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def add(self, host, visit_count=1, last_visit=None, source="history"):
+        key = self._normalize(host)
+        if not key:
+            return
+        entry = self.entries.get(key)
+        if entry is None:
+            bisect.insort(self.keys, key)
+            entry = self.entries[key] = {"visit_count": 0, "last_visit": 0, "bonus": 0}
+        entry["visit_count"] += visit_count
+        entry["last_visit"] = max(entry["last_visit"], last_visit or time.time())
+        entry["bonus"] = max(entry["bonus"], self.SOURCE_BONUS.get(source, 0))
+
+    def record_visit(self, host):
+        self.add(host)
+
+    @staticmethod
+    def _frecency(entry, now):
+        # Firefox'un frecency yaklaşımına benzer şekilde yakın zamandaki ziyaretler daha değerli
+        age_days = (now - entry["last_visit"]) / 86400
+        if age_days < 4:
+            weight = 100
+        elif age_days < 14:
+            weight = 70
+        elif age_days < 31:
+            weight = 50
+        elif age_days < 90:
+            weight = 30
+        else:
+            weight = 10
+        return entry["visit_count"] * weight + entry["bonus"]
+
+    def complete(self, text, limit=8):
+        prefix = self._normalize(text.strip())
+        if not prefix or " " in prefix:
+            return []
+        start = bisect.bisect_left(self.keys, prefix)
+        end = bisect.bisect_right(self.keys, prefix + "\uffff", start)
+        now = time.time()
+        return heapq.nlargest(limit, self.keys[start:end],
+                              key=lambda key: self._frecency(self.entries[key], now))
+
+    def __contains__(self, host):
+        return self._normalize(host) in self.entries
+
+
+# Motor adı (küçük harf) -> OpenSearch öneri adresi; {query} sorguyla değiştirilir
+DEFAULT_SUGGEST_URLS = {
+    "google": "https://suggestqueries.google.com/complete/search?client=firefox&ie=utf-8&oe=utf-8&q={query}",
+    "duckduckgo": "https://duckduckgo.com/ac/?type=list&q={query}",
+    "yandex": "https://suggest.yandex.com.tr/suggest-ff.cgi?part={query}&uil=tr",
+}
+
+
+class OpenSearchSuggestions:
+    # OpenSearch JSON biçimli öneri uç noktası: yanıt ["sorgu", ["öneri1", "öneri2", ...]].
+    # Arka uçlar sadece fetch(query) -> [öneri] metodu olan nesnelerdir; testlerde yerel bir
+    # sunucunun adresi --suggest-url ile verilebilir.
+    def __init__(self, url_template, user_agent="", timeout=2.0):
+        self.url_template = url_template
+        self.user_agent = user_agent
+        self.timeout = timeout
+
+    def fetch(self, query):
+        url = self.url_template.replace("{query}", QUrl.toPercentEncoding(query).data().decode("ascii"))
+        request = urllib.request.Request(url, headers={"User-Agent": self.user_agent} if self.user_agent else {})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            charset = response.headers.get_content_charset() or "utf-8"
+            data = json.loads(response.read(256 * 1024).decode(charset, "replace"))
+        if isinstance(data, list) and len(data) > 1 and isinstance(data[1], list):
+            return [item for item in data[1] if isinstance(item, str)]
+        return []
+
+
+class SuggestionService(QObject):
+    # Arama önerileri. Her istek sahibi (adres çubuğu, ana sayfa köprüsü) için tuş vuruşları
+    # debounce edilir, istek arka plandaki havuzda yapılır ve sonuç sinyalle arayüz iş
+    # parçacığına döner. Her yeni istek nesli öncekini geçersiz kılar: henüz başlamamış
+    # istek iptal edilir, bitmiş olanın sonucu sadece önbelleğe yazılır. Motor başına LRU
+    # önbellek TTL ile tutulur; ağdan öneri gelmezse yerel geçmiş eşleşmeleri döner.
+    suggestionsReady = pyqtSignal(object, str, list)  # istek sahibi, sorgu, öneriler
+    _fetched = pyqtSignal(object, int, str, str, object)  # iş parçacığından: sahip, nesil, motor, sorgu, sonuç
+
+    def __init__(self, backends, history=None, debounce_ms=150, cache_size=200, ttl=600, max_workers=2,
+                 parent=None):
+        super().__init__(parent)
+        self.backends = backends  # motor adı (küçük harf) -> fetch(query) metodu olan nesne
+        self.history = history
+        self.debounce_ms = debounce_ms
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self.caches = {}  # motor -> OrderedDict(sorgu -> (zaman, öneriler))
+        self._generations = collections.Counter()
+        self._pending = {}
+        self._timers = {}
+        self._futures = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                               thread_name_prefix="Suggestions")
+        self._fetched.connect(self._on_fetched)
+
+    def _cache_get(self, engine, text):
+        cache = self.caches.get(engine)
+        entry = cache.get(text.lower()) if cache else None
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del cache[text.lower()]
+            return None
+        cache.move_to_end(text.lower())
+        return entry[1]
+
+    def _cache_put(self, engine, text, suggestions):
+        cache = self.caches.setdefault(engine, collections.OrderedDict())
+        cache[text.lower()] = (time.monotonic(), suggestions)
+        cache.move_to_end(text.lower())
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def cancel(self, owner):
+        # Bekleyen ve süren istekleri geçersiz kılar (ör. kullanıcı Enter'a bastı)
+        self._generations[owner] += 1
+        self._pending.pop(owner, None)
+        if owner in self._timers:
+            self._timers[owner].stop()
+        future = self._futures.pop(owner, None)
+        if future is not None:
+            future.cancel()
+
+    def request(self, owner, engine, text):
+        self.cancel(owner)
+        text = text.strip()
+        engine = engine.lower()
+        if not text:
+            self.suggestionsReady.emit(owner, text, [])
+            return
+        cached = self._cache_get(engine, text)
+        if cached is not None:
+            self.suggestionsReady.emit(owner, text, cached)
+            return
+        self._pending[owner] = (self._generations[owner], engine, text)
+        timer = self._timers.get(owner)
+        if timer is None:
+            timer = self._timers[owner] = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda owner=owner: self._dispatch(owner))
+        timer.start(self.debounce_ms)
+
+    def _dispatch(self, owner):
+        if owner not in self._pending:
+            return
+        generation, engine, text = self._pending.pop(owner)
+        backend = self.backends.get(engine)
+        future = self._executor.submit(self._fetch, backend, text)
+        self._futures[owner] = future
+        future.add_done_callback(
+            lambda future, owner=owner, generation=generation, engine=engine, text=text:
+                None if future.cancelled() else self._fetched.emit(owner, generation, engine, text, future.result()))
+
+    def _fetch(self, backend, text):
+        # Arka plandaki iş parçacığında çalışır: (motorun önerileri, geçmiş eşleşmeleri). Motor
+        # hata verirse önerileri None olur; öneri gelmezse geçmiş araması da burada, arayüz
+        # iş parçacığının dışında yapılır.
+        suggestions = None
+        if backend is not None:
+            try:
+                suggestions = backend.fetch(text)
+            except Exception:
+                suggestions = None
+        return suggestions, [] if suggestions else self._history_matches(text)
+
+    def _on_fetched(self, owner, generation, engine, text, result):
+        suggestions, history_matches = result
+        if suggestions is not None:
+            self._cache_put(engine, text, suggestions)
+        if generation != self._generations[owner]:
+            # Bu arada yeni bir tuşa basıldı, eskimiş sonuç gösterilmez
+            return
+        self._futures.pop(owner, None)
+        self.suggestionsReady.emit(owner, text, suggestions or history_matches)
+
+    def _history_matches(self, text, limit=8):
+        if self.history is None:
+            return []
+        try:
+            return [row[0] for row in self.history.search(text, limit)]
+        except sqlite3.Error:
+            return []
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+def create_suggestion_service(args, profile, history):
+    urls = dict(DEFAULT_SUGGEST_URLS)
+    for override in args.suggest_url:
+        engine, _, url = override.partition("=")
+        if url:
+            urls[engine.strip().lower()] = url.strip()
+        else:
+            print(f"Geçersiz --suggest-url değeri (MOTOR=URL bekleniyor): {override}")
+    backends = {} if args.no_suggestions else {
+        engine: OpenSearchSuggestions(url, profile.httpUserAgent()) for engine, url in urls.items()}
+    return SuggestionService(backends, history)
+
+
+def _base_domain(host):
+    # Üçüncü taraf isteği ayırt etmek için kaba bir "kayıtlı alan adı" tahmini:
+    # www.example.com -> example.com, news.bbc.co.uk -> bbc.co.uk
+    parts = host.split(".")
+    if len(parts) > 2 and len(parts[-2]) <= 3 and len(parts[-1]) == 2:
+        return ".".join(parts[-3:])
+    return ".".join(parts[-2:])
+
+
+class FilterEngine:
+    # EasyList biçimindeki kuralları hızlı eşleşen bir yapıya derler:
+    #  - "||alanadi.com^" gibi seçeneksiz kurallar bir hash kümesine gider (host ve üst alan adları aranır)
+    #  - diğer kurallar, içlerindeki en uzun ve desen içinde iki yanı da sınırlı sabit kelimeye (token)
+    #    göre indekslenir; bir URL için sadece URL'deki token'lara bağlı kurallar denenir
+    #  - sınırlı token'ı olmayan kurallar sabit kısımlarından birinin GRAM_SIZE karakterlik bir
+    #    parçasına (n-gram) göre indekslenir; URL'nin n-gram'ları bir kümede aranır
+    # Kural regex'leri ilk kullanımda derlenir, böylece önbellekten yükleme sadece pickle okumaktır.
+    VERSION = 2
+    TOKEN_RE = re.compile(r"[a-z0-9%]{2,}")
+    GRAM_SIZE = 3
+    RESOURCE_TYPES = {"script", "image", "stylesheet", "object", "xmlhttprequest", "subdocument",
+                      "font", "media", "ping", "websocket", "other", "document"}
+    SUPPORTED_OPTIONS = {"third-party", "match-case", "domain"} | RESOURCE_TYPES
+
+    def __init__(self):
+        self.blocked_domains = set()
+        self.allowed_domains = set()
+        self.block_rules = {}
+        self.allow_rules = {}
+        self.block_gram_rules = {}
+        self.allow_gram_rules = {}
+        self.rule_count = 0
+        self._compiled = {}
+
+    @classmethod
+    def from_lines(cls, lines):
+        engine = cls()
+        for line in lines:
+            engine.add_rule(line.strip())
+        return engine
+
+    def add_rule(self, line):
+        if not line or line.startswith(("!", "[")) or "##" in line or "#@#" in line or "#?#" in line:
+            return
+        exception = line.startswith("@@")
+        if exception:
+            line = line[2:]
+
+        options = None
+        if "$" in line:
+            line, _, option_text = line.rpartition("$")
+            options = self._parse_options(option_text)
+            if options is False:
+                return  # desteklenmeyen seçenek: yanlış engellemektense kuralı atla
+
+        if options is None and line.startswith("||") and line.endswith("^"):
+            domain = line[2:-1]
+            if domain and all(c.isalnum() or c in ".-" for c in domain):
+                (self.allowed_domains if exception else self.blocked_domains).add(domain.lower())
+                self.rule_count += 1
+                return
+
+        if not line or line in ("*", "|", "||"):
+            return
+        rule = (self._to_regex(line, options), options)
+        token = self._pick_token(line)
+        if token:
+            rules = self.allow_rules if exception else self.block_rules
+            rules.setdefault(token, []).append(rule)
+        else:
+            gram_rules = self.allow_gram_rules if exception else self.block_gram_rules
+            gram = self._pick_gram(line, gram_rules)
+            if gram:
+                gram_rules.setdefault(gram, []).append(rule)
+            else:
+                rules = self.allow_rules if exception else self.block_rules
+                rules.setdefault("", []).append(rule)
+        self.rule_count += 1
+
+    def _parse_options(self, option_text):
+        # (üçüncü taraf?, izin verilen türler, hariç türler, dahil alan adları, hariç alan adları, büyük/küçük harf)
+        third_party = None
+        include_types, exclude_types = set(), set()
+        include_domains, exclude_domains = set(), set()
+        match_case = False
+        for option in option_text.split(","):
+            negated = option.startswith("~")
+            name = option.lstrip("~")
+            if name.startswith("domain="):
+                for domain in name[7:].split("|"):
+                    if domain.startswith("~"):
+                        exclude_domains.add(domain[1:].lower())
+                    else:
+                        include_domains.add(domain.lower())
+            elif name == "third-party":
+                third_party = not negated
+            elif name == "match-case":
+                match_case = True
+            elif name in self.RESOURCE_TYPES:
+                (exclude_types if negated else include_types).add(name)
+            else:
+                return False
+        return (third_party, frozenset(include_types), frozenset(exclude_types),
+                frozenset(include_domains), frozenset(exclude_domains), match_case)
+
+    @staticmethod
+    def _to_regex(pattern, options):
+        if pattern.startswith("/") and pattern.endswith("/") and len(pattern) > 2:
+            return pattern[1:-1]
+        regex = ""
+        if pattern.startswith("||"):
+            regex = r"^[a-z][a-z0-9+.-]*://([^/?#]*\.)?"
+            pattern = pattern[2:]
+        elif pattern.startswith("|"):
+            regex = "^"
+            pattern = pattern[1:]
+        anchored_end = pattern.endswith("|")
+        if anchored_end:
+            pattern = pattern[:-1]
+        # Uçtaki '*' her şeyle eşleşir; '.*' olarak bırakılırsa sadece aramayı yavaşlatır ve o uçtaki çapayı anlamsız kılar
+        if pattern.startswith("*"):
+            regex = ""
+            pattern = pattern.lstrip("*")
+        if pattern.endswith("*"):
+            anchored_end = False
+            pattern = pattern.rstrip("*")
+        for char in pattern:
+            if char == "*":
+                regex += ".*"
+            elif char == "^":
+                regex += r"(?:[^\w.%-]|$)"
+            else:
+                regex += re.escape(char)
+        if anchored_end:
+            regex += "$"
+        return regex
+
+    @classmethod
+    def _pick_token(cls, pattern):
+        if pattern.startswith("/") and pattern.endswith("/"):
+            return ""
+        start_anchored, end_anchored = pattern.startswith("|"), pattern.endswith("|")
+        body = pattern.strip("|").lower()
+        # Token URL'de tam bir token olarak geçmeli: iki yanında desen içinde '*' dışında bir ayırıcı
+        # olmalı ya da token desenin çapalı ucunda olmalı ("adserver", "myadserver.js" ile de eşleşir)
+        best = ""
+        for match in cls.TOKEN_RE.finditer(body):
+            start, end = match.span()
+            if not (body[start - 1] != "*" if start > 0 else start_anchored):
+                continue
+            if not (body[end] != "*" if end < len(body) else end_anchored):
+                continue
+            if len(match.group()) > len(best):
+                best = match.group()
+        return best
+
+    @classmethod
+    def _pick_gram(cls, pattern, gram_rules):
+        # Sabit kısımların n-gram'larından en az kurala bağlı olanı seçilir, böylece sık geçen
+        # parçalar (ör. "com") tek bir kovada birikmez
+        if pattern.startswith("/") and pattern.endswith("/"):
+            return ""
+        best, best_load = "", None
+        for part in re.split(r"[*^|]", pattern.lower()):
+            for i in range(len(part) - cls.GRAM_SIZE + 1):
+                gram = part[i:i + cls.GRAM_SIZE]
+                load = len(gram_rules.get(gram, ()))
+                if best_load is None or load < best_load:
+                    best, best_load = gram, load
+        return best
+
+    def _regex(self, source, match_case):
+        compiled = self._compiled.get((source, match_case))
+        if compiled is None:
+            try:
+                compiled = re.compile(source, 0 if match_case else re.IGNORECASE)
+            except re.error:
+                compiled = re.compile(r"(?!)")
+            self._compiled[(source, match_case)] = compiled
+        return compiled
+
+    @staticmethod
+    def _domain_hit(domains, host):
+        while host:
+            if host in domains:
+                return True
+            _, _, host = host.partition(".")
+        return False
+
+    def _rule_matches(self, rule, url, resource_type, third_party, page_host):
+        source, options = rule
+        if options is not None:
+            party, include_types, exclude_types, include_domains, exclude_domains, match_case = options
+            if party is not None and party != third_party:
+                return False
+            if include_types and resource_type not in include_types:
+                return False
+            if resource_type in exclude_types:
+                return False
+            if include_domains and not self._domain_hit(include_domains, page_host):
+                return False
+            if exclude_domains and self._domain_hit(exclude_domains, page_host):
+                return False
+        else:
+            match_case = False
+        return self._regex(source, match_case).search(url) is not None
+
+    def _match_rules(self, rules, url, tokens, resource_type, third_party, page_host):
+        for token in tokens:
+            for rule in rules.get(token, ()):
+                if self._rule_matches(rule, url, resource_type, third_party, page_host):
+                    return True
+        return False
+
+    def _url_grams(self, lower_url):
+        size = self.GRAM_SIZE
+        return {lower_url[i:i + size] for i in range(len(lower_url) - size + 1)}
+
+    def should_block(self, url, host, page_host="", resource_type="other"):
+        third_party = bool(page_host) and _base_domain(host) != _base_domain(page_host)
+        lower_url = url.lower()
+        tokens = self.TOKEN_RE.findall(lower_url)
+        tokens.append("")  # token'ı ve n-gram'ı olmayan kurallar
+        grams = self._url_grams(lower_url) if self.block_gram_rules else ()
+        blocked = (self._domain_hit(self.blocked_domains, host)
+                   or self._match_rules(self.block_rules, url, tokens, resource_type, third_party, page_host)
+                   or self._match_rules(self.block_gram_rules, url, grams, resource_type, third_party, page_host))
+        if not blocked:
+            return False
+        if self.allow_gram_rules and not grams:
+            grams = self._url_grams(lower_url)
+        return not (self._domain_hit(self.allowed_domains, host)
+                    or self._match_rules(self.allow_rules, url, tokens, resource_type, third_party, page_host)
+                    or self._match_rules(self.allow_gram_rules, url, grams, resource_type, third_party, page_host))
+
+    def _state(self):
+        # Sadece düz veri yazılır; derlenmiş regex'ler ve sınıf yolu önbelleğe girmez
+        return {name: getattr(self, name) for name in
+                ("blocked_domains", "allowed_domains", "block_rules", "allow_rules",
+                 "block_gram_rules", "allow_gram_rules", "rule_count")}
+
+    @classmethod
+    def load(cls, list_paths, cache_path):
+        # Önbellek anahtarı listelerin yolu, boyutu ve değişme zamanıdır; listeler değişmediyse
+        # on binlerce kuralı yeniden ayrıştırmak yerine derlenmiş hali pickle'dan okunur.
+        key = [cls.VERSION]
+        readable_paths = []
+        for path in list_paths:
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                print(f"Filtre listesi okunamadı, atlanıyor: {e}")
+                continue
+            readable_paths.append(path)
+            key.append((os.path.abspath(path), stat.st_size, stat.st_mtime))
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, state = pickle.load(f)
+            if cached_key == key:
+                engine = cls()
+                engine.__dict__.update(state)
+                return engine
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            pass
+
+        lines = []
+        for path in readable_paths:
+            try:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    lines.extend(f)
+            except OSError as e:
+                print(f"Filtre listesi okunamadı, atlanıyor: {e}")
+        engine = cls.from_lines(lines)
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+            temp_path = cache_path + ".tmp"
+            with open(temp_path, "wb") as f:
+                pickle.dump((key, engine._state()), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Filtre önbelleği yazılamadı: {e}")
+        return engine
+
+
+class ContentBlocker(QWebEngineUrlRequestInterceptor):
+    # Profil üzerindeki tüm istekleri FilterEngine ile kontrol eder ve sayfa başına
+    # engellenen istek sayısını ve tahmini tasarruf edilen baytı tutar. firstPartyUrl sadece
+    # site kökünü verdiği için sayım, PageRequestInterceptor'ın bildirdiği sayfaya yazılır.
+    RESOURCE_TYPE_NAMES = {
+        QWebEngineUrlRequestInfo.ResourceTypeMainFrame: "document",
+        QWebEngineUrlRequestInfo.ResourceTypeSubFrame: "subdocument",
+        QWebEngineUrlRequestInfo.ResourceTypeStylesheet: "stylesheet",
+        QWebEngineUrlRequestInfo.ResourceTypeScript: "script",
+        QWebEngineUrlRequestInfo.ResourceTypeImage: "image",
+        QWebEngineUrlRequestInfo.ResourceTypeFontResource: "font",
+        QWebEngineUrlRequestInfo.ResourceTypeObject: "object",
+        QWebEngineUrlRequestInfo.ResourceTypeMedia: "media",
+        QWebEngineUrlRequestInfo.ResourceTypeWorker: "script",
+        QWebEngineUrlRequestInfo.ResourceTypeSharedWorker: "script",
+        QWebEngineUrlRequestInfo.ResourceTypeServiceWorker: "script",
+        QWebEngineUrlRequestInfo.ResourceTypeFavicon: "image",
+        QWebEngineUrlRequestInfo.ResourceTypeXhr: "xmlhttprequest",
+        QWebEngineUrlRequestInfo.ResourceTypePing: "ping",
+        QWebEngineUrlRequestInfo.ResourceTypePluginResource: "object",
+    }
+    # Engellenen isteğin boyutu bilinemediği için türe göre ortalama boyut tahmini (bayt)
+    ESTIMATED_SIZES = {"script": 25000, "image": 15000, "subdocument": 40000, "stylesheet": 10000,
+                       "font": 30000, "media": 100000, "xmlhttprequest": 5000, "object": 50000}
+
+    def __init__(self, engine, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.enabled = True
+        self._lock = threading.Lock()
+        # sayfa kimliği (BrowserPage.page_id) -> [engellenen istek sayısı, tahmini bayt]
+        self._page_stats = collections.OrderedDict()
+        # Profil yakalayıcısında son engellenen istek (URL, tür); sayfa yakalayıcısı hemen ardından okur
+        self._last_blocked = None
+
+    def interceptRequest(self, info):
+        self._last_blocked = None
+        if not self.enabled:
+            return
+        resource_type = self.RESOURCE_TYPE_NAMES.get(info.resourceType(), "other")
+        if resource_type == "document":
+            return
+        url = info.requestUrl()
+        if url.scheme() not in ("http", "https", "ws", "wss"):
+            return
+        if self.engine.should_block(url.toString(), url.host(), info.firstPartyUrl().host(), resource_type):
+            info.block(True)
+            self._last_blocked = (url, resource_type)
+
+    def interceptPageRequest(self, info, page_id):
+        if info.resourceType() == QWebEngineUrlRequestInfo.ResourceTypeMainFrame:
+            # Yeni bir ana sayfa yükleniyor, o sayfanın sayacını sıfırla
+            with self._lock:
+                self._page_stats.pop(page_id, None)
+            return
+        last_blocked, self._last_blocked = self._last_blocked, None
+        if last_blocked is None or last_blocked[0] != info.requestUrl():
+            return
+        with self._lock:
+            stats = self._page_stats.setdefault(page_id, [0, 0])
+            stats[0] += 1
+            stats[1] += self.ESTIMATED_SIZES.get(last_blocked[1], 5000)
+            self._page_stats.move_to_end(page_id)
+            while len(self._page_stats) > 500:
+                self._page_stats.popitem(last=False)
+
+    def page_stats(self, page):
+        with self._lock:
+            blocked, saved = self._page_stats.get(getattr(page, "page_id", None), (0, 0))
+        return blocked, saved
+
+
+def create_content_blocker(args, profile):
+    list_paths = list(args.filter_list)
+    list_paths += sorted(glob.glob(os.path.join(profile.persistentStoragePath(), "filters", "*.txt")))
+    if args.no_content_blocker or not list_paths:
+        return None
+    started = time.perf_counter()
+    engine = FilterEngine.load(list_paths, os.path.join(profile.persistentStoragePath(), "filters.cache"))
+    blocker = ContentBlocker(engine, profile)
+    print(f"İçerik engelleyici: {engine.rule_count} kural ({(time.perf_counter() - started) * 1000:.0f} ms)")
+    return blocker
+
+
+class PageRequestInterceptor(QWebEngineUrlRequestInterceptor):
+    # Tek bir sayfanın istekleri için (Qt >= 5.13). Qt bunu aynı istek için profil yakalayıcısından
+    # hemen sonra, yine arayüz iş parçacığında çağırır; böylece profil düzeyinde verilen karar
+    # isteği başlatan sayfaya yazılabilir.
+    def __init__(self, page_id, handlers, parent=None):
+        super().__init__(parent)
+        self.page_id = page_id
+        self.handlers = handlers  # interceptPageRequest(info, page_id) metodu olan nesneler
+
+    def interceptRequest(self, info):
+        for handler in self.handlers:
+            handler.interceptPageRequest(info, self.page_id)
+
+
+class RequestInterceptorChain(QWebEngineUrlRequestInterceptor):
+    # Profile yalnızca bir istek yakalayıcı takılabildiği için istek kaydedici ve içerik
+    # engelleyici bu zincir üzerinden sırayla çağrılır.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.interceptors = []
+
+    def add(self, interceptor):
+        # interceptor: interceptRequest(info) metodu olan herhangi bir nesne
+        self.interceptors.append(interceptor)
+
+    def interceptRequest(self, info):
+        for interceptor in self.interceptors:
+            interceptor.interceptRequest(info)
+
+
+class RequestRecorder:
+    # Profilin tüm istekleri sabit boyutlu, önceden ayrılmış bir halka tampona yazılır: her alan
+    # için kapasite uzunluğunda bir dizi tutulur ve kayıt sadece yerinde atamadır (nesne ya da
+    # metin üretilmez, QUrl'ler dışa aktarırken metne çevrilir). Tampon dolunca en eski
+    # kayıtların üzerine yazılır.
+    def __init__(self, capacity=10000, enabled=False):
+        self.capacity = max(1, capacity)
+        self.enabled = enabled
+        self.times = array.array("d", bytes(8 * self.capacity))
+        # ResourceType değerleri 0..255 (ResourceTypeUnknown = 255), işaretsiz tür gerekir
+        self.types = array.array("B", bytes(self.capacity))
+        self.methods = [None] * self.capacity
+        self.urls = [None] * self.capacity
+        self.initiators = [None] * self.capacity
+        self.first_parties = [None] * self.capacity
+        # İsteği başlatan sayfanın kimliği (BrowserPage.page_id, 0 = bilinmiyor); firstPartyUrl
+        # sadece site kökünü verdiği için sayfa ayrımı buna göre yapılır
+        self.pages = array.array("I", bytes(4 * self.capacity))
+        self.next = 0
+        self.count = 0
+        self._last_index = None  # profil yakalayıcısında son yazılan kayıt; sayfa yakalayıcısı etiketler
+        self._lock = threading.Lock()
+
+    def interceptRequest(self, info):
+        self._last_index = None
+        if not self.enabled:
+            return
+        with self._lock:
+            i = self._last_index = self.next
+            self.times[i] = time.time()
+            self.types[i] = info.resourceType()
+            self.methods[i] = info.requestMethod()
+            self.urls[i] = info.requestUrl()
+            self.initiators[i] = info.initiator()
+            self.first_parties[i] = info.firstPartyUrl()
+            self.pages[i] = 0
+            self.next = (i + 1) % self.capacity
+            if self.count < self.capacity:
+                self.count += 1
+
+    def interceptPageRequest(self, info, page_id):
+        i, self._last_index = self._last_index, None
+        if i is None:
+            return
+        with self._lock:
+            if self.urls[i] == info.requestUrl():
+                self.pages[i] = page_id
+
+    def clear(self):
+        with self._lock:
+            self.next = self.count = 0
+
+    def records(self):
+        # Eskiden yeniye kayıtlar
+        with self._lock:
+            start = (self.next - self.count) % self.capacity
+            indexes = [(start + offset) % self.capacity for offset in range(self.count)]
+            rows = [(self.times[i], self.types[i], self.methods[i], self.urls[i], self.initiators[i],
+                     self.first_parties[i], self.pages[i]) for i in indexes]
+        return [{
+            "time": timestamp,
+            "type": ContentBlocker.RESOURCE_TYPE_NAMES.get(resource_type, "other"),
+            "method": bytes(method).decode("ascii", "replace"),
+            "url": url.toString(),
+            "initiator": initiator.toString(),
+            "first_party": first_party.toString(),
+            "page": page_id,
+        } for timestamp, resource_type, method, url, initiator, first_party, page_id in rows]
+
+    def page_requests(self, page):
+        # Sayfanın son yüklenişine ait istekler: o sayfanın son ana çerçeve isteği ve sonrasında
+        # o sayfanın başlattığı tüm istekler
+        page_id = getattr(page, "page_id", None)
+        records = [record for record in self.records() if record["page"] == page_id]
+        start = 0
+        for index in range(len(records) - 1, -1, -1):
+            if records[index]["type"] == "document":
+                start = index
+                break
+        return records[start:]
+
+
+def _har_time(milliseconds):
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(milliseconds / 1000)) + f".{int(milliseconds % 1000):03d}Z"
+
+
+def build_har(records, page_url, title, timings=None):
+    # records: RequestRecorder.page_requests çıktısı. timings: sayfadaki Resource Timing verisi
+    # (HAR_TIMINGS_JS); yoksa sadece istek zamanları yazılır. Yanıt durum kodu ve başlıkları
+    # istek yakalayıcıdan görülemediği için HAR'da status 0 ve boş başlıklarla yer alır.
+    timings = timings or {}
+    resources = {}
+    for entry in timings.get("resources") or ():
+        resources.setdefault(entry["name"], collections.deque()).append(entry)
+    navigation = timings.get("navigation")
+    origin = timings.get("origin")
+
+    def milliseconds(value):
+        return round(value, 3) if value is not None and value >= 0 else -1
+
+    entries = []
+    for record in records:
+        if record["type"] == "document" and record["url"] == page_url and navigation:
+            timing = navigation
+        else:
+            queue = resources.get(record["url"])
+            timing = queue.popleft() if queue else None
+        started = origin + timing["start"] if timing and origin else record["time"] * 1000
+        protocol = (timing or {}).get("protocol") or ""
+        body_size = (timing or {}).get("body", 0)
+        query = QUrlQuery(QUrl(record["url"]))
+        entries.append({
+            "pageref": "page_1",
+            "startedDateTime": _har_time(started),
+            "time": milliseconds(timing["duration"]) if timing else 0,
+            "request": {
+                "method": record["method"], "url": record["url"], "httpVersion": protocol,
+                "cookies": [], "headers": [], "headersSize": -1, "bodySize": -1,
+                "queryString": [{"name": name, "value": value}
+                                for name, value in query.queryItems(QUrl.FullyDecoded)],
+            },
+            "response": {
+                "status": 0, "statusText": "", "httpVersion": protocol, "cookies": [], "headers": [],
+                "content": {"size": body_size, "mimeType": ""}, "redirectURL": "",
+                "headersSize": -1, "bodySize": body_size or -1,
+                "_transferSize": (timing or {}).get("size", 0),
+            },
+            "cache": {},
+            "timings": {
+                "blocked": -1,
+                "dns": milliseconds(timing["dns"]) if timing else -1,
+                "connect": milliseconds(timing["connect"]) if timing else -1,
+                "ssl": milliseconds(timing["ssl"]) if timing else -1,
+                "send": 0,
+                "wait": max(milliseconds(timing["wait"]), 0) if timing else 0,
+                "receive": max(milliseconds(timing["receive"]), 0) if timing else 0,
+            },
+            "_resourceType": record["type"],
+            "_initiator": record["initiator"],
+            "_firstParty": record["first_party"],
+        })
+    page_started = origin if origin else (records[0]["time"] * 1000 if records else time.time() * 1000)
+    return {"log": {
+        "version": "1.2",
+        "creator": {"name": "Cheetares", "version": "1.0"},
+        "pages": [{
+            "startedDateTime": _har_time(page_started),
+            "id": "page_1",
+            "title": title or page_url,
+            "pageTimings": {
+                "onContentLoad": milliseconds(navigation["dcl"]) if navigation else -1,
+                "onLoad": milliseconds(navigation["load"]) if navigation else -1,
+            },
+        }],
+        "entries": entries,
+    }}
+
+
+def register_internal_scheme():
+    # Şemalar QApplication oluşturulmadan önce kaydedilmeli.
+    # LocalScheme: web sayfaları cheetares:// adreslerini açamaz, SecureScheme: güvenli bağlam sayılır.
+    scheme = QWebEngineUrlScheme(INTERNAL_SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(QWebEngineUrlScheme.SecureScheme | QWebEngineUrlScheme.LocalScheme)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def is_home_url(url):
+    return url.scheme() == INTERNAL_SCHEME.decode() and url.host() == "home"
+
+
+def _load_bundled_resources():
+    # Ana sayfanın dosyaları başlangıçta uygulama dizininden bir kez okunup bellekte tutulur;
+    # sonrasında çalışma dizini ne olursa olsun sayfa diskten okunmadan sunulur.
+    files = {
+        "/": ("index.html", b"text/html"),
+        "/style.css": ("style.css", b"text/css"),
+        "/cheetares_logo.svg": ("cheetares_logo.svg", b"image/svg+xml"),
+        "/cheetares_logo.png": ("cheetares_logo.png", b"image/png"),
+    }
+    resources = {}
+    for path, (file_name, mime_type) in files.items():
+        try:
+            with open(os.path.join(APP_DIR, file_name), "rb") as f:
+                resources[path] = (mime_type, f.read())
+        except OSError:
+            print(f"{file_name} bulunamadı, ana sayfa eksik görünebilir.")
+    return resources
+
+
+class InternalSchemeHandler(QWebEngineUrlSchemeHandler):
+    # cheetares://<host>/<yol> isteklerini bellekteki verilerden yanıtlar. Statik dosyalar
+    # dışında diğer bileşenler add_page ile dinamik olarak üretilen sayfalar ekleyebilir.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.static = {("home", path): resource for path, resource in _load_bundled_resources().items()}
+        self.pages = {}
+
+    def add_page(self, host, callback):
+        # callback(url) -> (mime_type, bytes)
+        self.pages[host] = callback
+
+    def requestStarted(self, job):
+        url = job.requestUrl()
+        path = url.path() or "/"
+        try:
+            if (url.host(), path) in self.static:
+                mime_type, data = self.static[(url.host(), path)]
+            elif url.host() in self.pages:
+                # Sayfa üreticisi None dönerse istenen kaynak yok demektir
+                result = self.pages[url.host()](url)
+                if result is None:
+                    job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+                    return
+                mime_type, data = result
+            else:
+                job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+                return
+        except Exception as e:
+            print(f"Dahili sayfa oluşturulamadı ({url.toString()}): {e}")
+            job.fail(QWebEngineUrlRequestJob.RequestFailed)
+            return
+        # Tampon job'a bağlanır, istek bitince job ile birlikte silinir
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        job.reply(mime_type, buffer)
+
+
+# Yerleşik temalar. Profil dizinindeki themes/*.json dosyaları aynı biçimde yeni temalar
+# ekleyebilir; eksik renkler page_theme'deki (light/dark) yerleşik temadan alınır.
+BUILTIN_THEMES = {
+    "light": {
+        "name": "Açık",
+        "page_theme": "light",
+        "colors": {
+            "window_bg": "#f0f2f5", "text": "black",
+            "toolbar_bg": "#ffffff", "toolbar_border": "#e0e0e0",
+            "input_bg": "#f8f9fa", "border": "#ced4da",
+            "button_bg": "#f8f9fa", "button_hover": "#e2e6ea", "button_pressed": "#dae0e5",
+            "accent_bg": "#007bff", "accent_text": "white",
+            "accent_hover": "#0056b3", "accent_pressed": "#003e80",
+        },
+    },
+    "dark": {
+        "name": "Koyu",
+        "page_theme": "dark",
+        "colors": {
+            "window_bg": "#1e1e1e", "text": "white",
+            "toolbar_bg": "#2e2e2e", "toolbar_border": "#3a3a3a",
+            "input_bg": "#3e3e3e", "border": "#555",
+            "button_bg": "#4e4e4e", "button_hover": "#6a6a6a", "button_pressed": "#888888",
+            "accent_bg": "#4e4e4e", "accent_text": "white",
+            "accent_hover": "#6a6a6a", "accent_pressed": "#888888",
+        },
+    },
+}
+
+
+class ThemeRegistry:
+    # Temalar veri olarak tutulur. Her temanın stil sayfaları ilk kullanımda şablondan bir kez
+    # üretilir ve önbelleğe alınır; tema değiştirmek sadece hazır metni uygulamaktır.
+    TOOLBAR_QSS = string.Template("""
+        QToolBar {
+            background-color: $toolbar_bg;
+            border: none;
+            border-bottom: 1px solid $toolbar_border;
+            padding: 5px;
+        }
+        QLineEdit {
+            background-color: $input_bg;
+            color: $text;
+            border: 1px solid $border;
+            border-radius: 10px;
+            padding: 5px 10px;
+        }
+        QToolButton {
+            background-color: $button_bg;
+            color: $text;
+            border: 1px solid $border;
+            border-radius: 5px;
+            margin: 2px;
+            padding: 5px 8px 5px 30px;
+            font-size: 14px;
+        }
+        QToolButton:hover {
+            background-color: $button_hover;
+        }
+        QToolButton:pressed, QToolButton:checked {
+            background-color: $button_pressed;
+        }
+        QPushButton#searchEngineButton {
+            background-color: $accent_bg;
+            color: $accent_text;
+            border: none;
+            border-radius: 5px;
+            padding: 5px;
+            margin: 2px;
+            font-size: 14px;
+        }
+        QPushButton#searchEngineButton:hover {
+            background-color: $accent_hover;
+        }
+        QPushButton#searchEngineButton:pressed {
+            background-color: $accent_pressed;
+        }
+    """)
+    TABBAR_QSS = string.Template("""
+        QTabBar {
+            background-color: $toolbar_bg;
+        }
+        QTabBar::tab {
+            background-color: $toolbar_bg;
+            color: $text;
+            border: none;
+            border-bottom: 2px solid transparent;
+            padding: 6px 12px;
+        }
+        QTabBar::tab:selected {
+            background-color: $button_bg;
+            border-bottom: 2px solid $accent_hover;
+        }
+        QTabBar::tab:hover {
+            background-color: $button_hover;
+        }
+    """)
+    STATUSBAR_QSS = string.Template("""
+        QStatusBar {
+            background-color: $toolbar_bg;
+            color: $text;
+            border-top: 1px solid $toolbar_border;
+        }
+    """)
+
+    def __init__(self, user_theme_dir=None):
+        self.themes = {name: theme for name, theme in BUILTIN_THEMES.items()}
+        self._stylesheets = {}
+        if user_theme_dir:
+            for path in sorted(glob.glob(os.path.join(user_theme_dir, "*.json"))):
+                self._load_theme_file(path)
+
+    def _load_theme_file(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Tema dosyası okunamadı ({path}): {e}")
+            return
+        # Bozuk tema dosyası tarayıcıyı düşürmez; dosya atlanır
+        if not isinstance(data, dict):
+            print(f"Tema dosyası geçersiz, atlandı ({path}): JSON nesnesi bekleniyordu")
+            return
+        custom_colors = data.get("colors", {})
+        if not isinstance(custom_colors, dict) or not all(
+                isinstance(key, str) and isinstance(value, str) for key, value in custom_colors.items()):
+            print(f"Tema dosyası geçersiz, atlandı ({path}): 'colors' metin değerli bir nesne olmalı")
+            return
+        page_theme = data.get("page_theme", "light")
+        if not isinstance(page_theme, str) or page_theme not in BUILTIN_THEMES:
+            page_theme = "light"
+        colors = dict(BUILTIN_THEMES[page_theme]["colors"])
+        colors.update(custom_colors)
+        name = os.path.splitext(os.path.basename(path))[0]
+        title = data.get("name", name)
+        self.themes[name] = {"name": title if isinstance(title, str) else name,
+                             "page_theme": page_theme, "colors": colors}
+
+    def names(self):
+        return list(self.themes)
+
+    def get(self, name):
+        return self.themes.get(name) or self.themes["light"]
+
+    def next_name(self, name):
+        names = self.names()
+        index = names.index(name) if name in names else -1
+        return names[(index + 1) % len(names)]
+
+    def stylesheets(self, name):
+        stylesheets = self._stylesheets.get(name)
+        if stylesheets is None:
+            colors = self.get(name)["colors"]
+            stylesheets = {
+                "toolbar": self.TOOLBAR_QSS.safe_substitute(colors),
+                "tabbar": self.TABBAR_QSS.safe_substitute(colors),
+                "statusbar": self.STATUSBAR_QSS.safe_substitute(colors),
+            }
+            self._stylesheets[name] = stylesheets
+        return stylesheets
+
+
+def make_user_script(name, source, world_id=QWebEngineScript.MainWorld,
+                     injection_point=QWebEngineScript.DocumentCreation):
+    # Sayfa oluşturulurken (ilk çizimden önce) çalışacak bir kullanıcı betiği
+    script = QWebEngineScript()
+    script.setName(name)
+    script.setSourceCode(source)
+    script.setWorldId(world_id)
+    script.setInjectionPoint(injection_point)
+    script.setRunsOnSubFrames(False)
+    return script
+
+
+# Sıradan web sayfaları için karanlık mod: sadece açıkken betik listesinde bulunur,
+# kapalıyken sayfa yüklemelerine hiçbir maliyeti yoktur.
+WEB_DARK_MODE_JS = """
+(function () {
+    if (location.protocol === 'cheetares:') return;
+    var style = document.createElement('style');
+    style.id = 'cheetares-dark-mode';
+    style.textContent = 'html { filter: invert(0.9) hue-rotate(180deg); background: #fff; }' +
+        ' img, video, picture, canvas, iframe, embed, object { filter: invert(1) hue-rotate(180deg); }';
+    document.documentElement.appendChild(style);
+})();
+"""
+
+
+def _qwebchannel_js():
+    # qwebchannel.js QtWebChannel ile birlikte Qt kaynaklarında gelir
+    resource = QFile(":/qtwebchannel/qwebchannel.js")
+    if not resource.open(QIODevice.ReadOnly):
+        return ""
+    source = bytes(resource.readAll()).decode("utf-8")
+    resource.close()
+    return source
+
+
+# Sayfa yüklendikten sonra Navigation Timing ve Paint Timing verilerini toplayıp
+# ApplicationWorld'deki QWebChannel üzerinden pyqt köprüsüne gönderir.
+PERF_REPORT_JS = """
+(function () {
+    if (location.protocol !== 'http:' && location.protocol !== 'https:') return;
+    function round(value) { return Math.round(value * 10) / 10; }
+    function collect() {
+        var nav = performance.getEntriesByType('navigation')[0];
+        if (!nav) return null;
+        var paints = {};
+        performance.getEntriesByType('paint').forEach(function (entry) { paints[entry.name] = entry.startTime; });
+        var resources = performance.getEntriesByType('resource').map(function (entry) {
+            return {url: entry.name, type: entry.initiatorType, duration: round(entry.duration),
+                    size: entry.transferSize || 0};
+        }).sort(function (a, b) { return b.duration - a.duration; });
+        return {
+            url: location.href,
+            dns: round(nav.domainLookupEnd - nav.domainLookupStart),
+            connect: round(nav.connectEnd - nav.connectStart),
+            ttfb: round(nav.responseStart - nav.requestStart),
+            dcl: round(nav.domContentLoadedEventEnd),
+            fcp: paints['first-contentful-paint'] !== undefined ? round(paints['first-contentful-paint']) : null,
+            load: round(nav.loadEventEnd),
+            transfer: nav.transferSize || 0,
+            resource_count: resources.length,
+            slowest: resources.slice(0, 10)
+        };
+    }
+    function report() {
+        // loadEventEnd, load olayının işleyicileri bittikten sonra dolar
+        setTimeout(function () {
+            var data = collect();
+            if (!data) return;
+            new QWebChannel(qt.webChannelTransport, function (channel) {
+                channel.objects.pyqt.reportPerformance(JSON.stringify(data));
+            });
+        }, 0);
+    }
+    if (document.readyState === 'complete') {
+        report();
+    } else {
+        window.addEventListener('load', report);
+    }
+})();
+"""
+
+# Ana sayfa ile Python arasındaki köprü. Bir sayfada tek QWebChannel olabildiği için ana sayfanın
+# tüm işleri burada: bağlantıların üzerine gelindiğinde haber verir (preconnect + prerender) ve
+# arama kutusu için önerileri isteyip datalist'e doldurur.
+HOME_PAGE_JS = """
+(function () {
+    if (location.protocol !== 'cheetares:' || location.host !== 'home') return;
+    var bridge = null;
+    var lastLink = null;
+    var lastQuery = '';
+    var input = document.getElementById('searchInput');
+    var list = document.getElementById('searchSuggestions');
+    new QWebChannel(qt.webChannelTransport, function (channel) {
+        bridge = channel.objects.pyqt;
+        bridge.suggestionsReady.connect(function (text, items) {
+            // Köprü penceredeki tüm sekmelerle paylaşılır; sadece bu sayfanın son sorgusu işlenir
+            if (!list || text !== lastQuery) return;
+            list.textContent = '';
+            items.forEach(function (item) {
+                var option = document.createElement('option');
+                option.value = item;
+                list.appendChild(option);
+            });
+        });
+    });
+    document.addEventListener('mouseover', function (event) {
+        var link = event.target.closest('a[href]');
+        if (!link || !bridge || link.href === lastLink) return;
+        lastLink = link.href;
+        bridge.speculate(link.href);
+    });
+    if (input && list) {
+        input.addEventListener('input', function () {
+            lastQuery = input.value.trim();
+            if (bridge) bridge.requestSuggestions(document.getElementById('searchEngine').value, lastQuery);
+        });
+    }
+})();
+"""
+
+# HAR dışa aktarımı için sayfanın Resource Timing verisi (ApplicationWorld'de çalıştırılır)
+HAR_TIMINGS_JS = """
+(function () {
+    function entry(e) {
+        return {name: e.name, start: e.startTime, duration: e.duration,
+                dns: e.domainLookupEnd - e.domainLookupStart,
+                connect: e.connectEnd - e.connectStart,
+                ssl: e.secureConnectionStart > 0 ? e.connectEnd - e.secureConnectionStart : -1,
+                wait: e.responseStart - e.requestStart,
+                receive: e.responseEnd - e.responseStart,
+                size: e.transferSize || 0, body: e.encodedBodySize || 0, protocol: e.nextHopProtocol || ''};
+    }
+    var nav = performance.getEntriesByType('navigation')[0];
+    var navigation = null;
+    if (nav) {
+        navigation = entry(nav);
+        navigation.dcl = nav.domContentLoadedEventEnd;
+        navigation.load = nav.loadEventEnd;
+    }
+    return JSON.stringify({origin: performance.timeOrigin, navigation: navigation,
+                           resources: performance.getEntriesByType('resource').map(entry)});
+})();
+"""
+
+# Chromium varsayılan olarak sadece 250 Resource Timing kaydı tutar; çok istekli sayfalarda
+# HAR'daki süreler eksik kalmasın diye tampon sayfa oluşturulurken büyütülür
+RESOURCE_TIMING_BUFFER_JS = "performance.setResourceTimingBufferSize(5000);"
+
+# Gizli sayfaya preconnect ve dns-prefetch bağlantıları ekler; eskiler listeden düşer
+PRECONNECT_JS = """
+(function (origin) {
+    ['dns-prefetch', 'preconnect'].forEach(function (rel) {
+        var link = document.createElement('link');
+        link.rel = rel;
+        link.href = origin;
+        document.head.appendChild(link);
+    });
+    while (document.head.children.length > %d) document.head.removeChild(document.head.firstChild);
+})(%s);
+"""
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class PerfMonitor:
+    # Sayfa yükleme ölçümleri sabit boyutlu bir halka tamponda (deque) tutulur; en eski kayıt
+    # otomatik düşer. İstenirse her kayıt bir JSONL dosyasına da eklenir.
+    METRICS = ("dns", "connect", "ttfb", "dcl", "fcp", "load")
+
+    def __init__(self, capacity=500, export_path=None):
+        self.records = collections.deque(maxlen=capacity)
+        self.export_path = export_path
+        # Speculator sayaçları: preconnects, prerenders, hits, misses, failed, saved_ms
+        self.speculation = collections.Counter()
+
+    def record(self, data):
+        data["host"] = QUrl(data.get("url", "")).host()
+        data["time"] = time.time()
+        self.records.append(data)
+        if self.export_path:
+            try:
+                with open(self.export_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(data, ensure_ascii=False) + "\n")
+            except OSError as e:
+                print(f"Performans kaydı yazılamadı: {e}")
+
+    def recent(self, limit=50):
+        return list(self.records)[-limit:][::-1]
+
+    def host_percentiles(self):
+        by_host = {}
+        for record in self.records:
+            by_host.setdefault(record["host"], []).append(record)
+        stats = {}
+        for host, records in by_host.items():
+            stats[host] = {"count": len(records)}
+            for metric in self.METRICS:
+                values = [r[metric] for r in records if r.get(metric) is not None]
+                if values:
+                    stats[host][metric] = (_percentile(values, 50), _percentile(values, 90), _percentile(values, 99))
+        return stats
+
+    def slowest_resources(self, limit=20):
+        resources = [dict(resource, page=record["url"]) for record in self.records
+                     for resource in record.get("slowest", ())]
+        return heapq.nlargest(limit, resources, key=lambda resource: resource["duration"])
+
+    def speculation_summary(self):
+        stats = self.speculation
+        used = stats["hits"] + stats["misses"]
+        return {
+            "preconnects": stats["preconnects"],
+            "prerenders": stats["prerenders"],
+            "hits": stats["hits"],
+            "hit_rate": stats["hits"] / used if used else None,
+            "saved_ms": stats["saved_ms"],
+            "avg_saved_ms": stats["saved_ms"] / stats["hits"] if stats["hits"] else None,
+        }
+
+    def render_page(self, url):
+        # cheetares://perf sayfası
+        def cell(value):
+            return "-" if value is None else html.escape(str(value))
+
+        rows = "".join(
+            "<tr><td>{}</td>{}<td>{}</td></tr>".format(
+                cell(r["url"][:80]), "".join(f"<td>{cell(r.get(m))}</td>" for m in self.METRICS),
+                cell(r.get("resource_count")))
+            for r in self.recent())
+        host_rows = "".join(
+            "<tr><td>{}</td><td>{}</td>{}</tr>".format(
+                cell(host), stats["count"],
+                "".join("<td>{}</td>".format(
+                    " / ".join(f"{v:.0f}" for v in stats[m]) if m in stats else "-") for m in self.METRICS))
+            for host, stats in sorted(self.host_percentiles().items()))
+        resource_rows = "".join(
+            f"<tr><td>{cell(r['url'][:100])}</td><td>{cell(r['type'])}</td><td>{cell(r['duration'])}</td>"
+            f"<td>{cell(r['size'])}</td><td>{cell(r['page'][:60])}</td></tr>"
+            for r in self.slowest_resources())
+        metric_headers = "".join(f"<th>{m}</th>" for m in self.METRICS)
+        speculation = self.speculation_summary()
+        hit_rate = "-" if speculation["hit_rate"] is None else f"%{speculation['hit_rate'] * 100:.0f}"
+        avg_saved = "-" if speculation["avg_saved_ms"] is None else f"{speculation['avg_saved_ms']:.0f}"
+        return _internal_page("Performans", f"""<h1>Performans</h1>
+<h2>Son yüklemeler (ms)</h2>
+<table><tr><th>URL</th>{metric_headers}<th>kaynak</th></tr>{rows}</table>
+<h2>Host başına p50 / p90 / p99 (ms)</h2>
+<table><tr><th>Host</th><th>yükleme</th>{metric_headers}</tr>{host_rows}</table>
+<h2>En yavaş kaynaklar</h2>
+<table><tr><th>URL</th><th>tür</th><th>süre (ms)</th><th>bayt</th><th>sayfa</th></tr>{resource_rows}</table>
+<h2>Spekülatif yükleme</h2>
+<table><tr><th>preconnect</th><th>prerender</th><th>isabet</th><th>isabet oranı</th><th>kazanılan (ms)</th><th>isabet başına (ms)</th></tr>
+<tr><td>{speculation["preconnects"]}</td><td>{speculation["prerenders"]}</td><td>{speculation["hits"]}</td>
+<td>{hit_rate}</td><td>{speculation["saved_ms"]:.0f}</td><td>{avg_saved}</td></tr></table>""")
+
+
+class TokenBucket:
+    # Tüm indirme bağlantılarının paylaştığı hız sınırlayıcı (bayt/sn, 0 = sınırsız)
+    def __init__(self, rate=0):
+        self.rate = rate
+        self._allowance = rate
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount):
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(self.rate, self._allowance + (now - self._last) * self.rate)
+            self._last = now
+            self._allowance -= amount
+            wait = -self._allowance / self.rate if self._allowance < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+class RangeMismatch(ValueError):
+    # Sunucu istenen aralığı vermedi (200 ile tüm dosya, başka bir aralık ya da dosya değişti)
+    pass
+
+
+class SegmentedDownload:
+    # Bir dosyayı birden çok HTTP Range bağlantısıyla indirir. Veri, tam boyutta önceden
+    # ayrılmış <dosya>.part dosyasına her parçanın kendi konumundan doğrudan yazılır; bellekte
+    # biriktirilmez. Parçaların ilerlemesi <dosya>.cheetares-download dosyasında tutulur,
+    # böylece kesilen indirme kaldığı yerden devam eder.
+    CHUNK_SIZE = 64 * 1024
+    MIN_SEGMENT_SIZE = 1024 * 1024
+    STATE_SUFFIX = ".cheetares-download"
+
+    def __init__(self, url, path, user_agent=""):
+        self.url = url
+        self.path = path
+        self.part_path = path + ".part"
+        self.state_path = path + self.STATE_SUFFIX
+        self.user_agent = user_agent
+        self.cookie_header = ""  # DownloadManager her başlatmada profilin çerezlerinden doldurur
+        self.size = None
+        self.ranged = False
+        self.validator = None  # ETag ya da Last-Modified; devam ederken If-Range ile gönderilir
+        self.segments = []  # [başlangıç, bitiş (dahil, boyut bilinmiyorsa None), konum]
+        self.status = "bekliyor"
+        self.error = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._running = False  # son istenen durum: start True, pause False yapar
+        self._thread = None
+        self._samples = collections.deque(maxlen=10)
+
+    @property
+    def file_name(self):
+        return os.path.basename(self.path)
+
+    @property
+    def bytes_done(self):
+        with self._lock:
+            return sum(position - start for start, _, position in self.segments)
+
+    def throughput(self):
+        # Son birkaç saniyedeki ortalama hız (bayt/sn); arayüzün yenileme zamanlayıcısından çağrılır
+        now, done = time.monotonic(), self.bytes_done
+        self._samples.append((now, done))
+        first_time, first_done = self._samples[0]
+        return (done - first_done) / (now - first_time) if now > first_time else 0
+
+    def _request(self, method="GET", headers=None):
+        request = urllib.request.Request(self.url, method=method, headers=headers or {})
+        if self.user_agent:
+            request.add_header("User-Agent", self.user_agent)
+        if self.cookie_header:
+            request.add_header("Cookie", self.cookie_header)
+        return urllib.request.urlopen(request, timeout=30)
+
+    def _probe(self):
+        # Boyutu ve Range desteğini öğrenmek için tek baytlık bir Range isteği
+        with self._request(headers={"Range": "bytes=0-0"}) as response:
+            content_range = response.headers.get("Content-Range", "")
+            if response.status == 206 and "/" in content_range and not content_range.endswith("/*"):
+                self.size = int(content_range.rsplit("/", 1)[1])
+                self.ranged = True
+                self.validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+            else:
+                length = response.headers.get("Content-Length")
+                self.size = int(length) if length else None
+                self.ranged = False
+
+    def _plan(self, segment_count):
+        if not self.ranged or not self.size:
+            self.segments = [[0, self.size - 1 if self.size else None, 0]]
+            return
+        count = max(1, min(segment_count, self.size // self.MIN_SEGMENT_SIZE))
+        step = self.size // count
+        self.segments = []
+        for index in range(count):
+            start = index * step
+            end = self.size - 1 if index == count - 1 else start + step - 1
+            self.segments.append([start, end, start])
+
+    def load_state(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if state.get("url") != self.url or not os.path.exists(self.part_path):
+            return False
+        self.size, self.ranged, self.segments = state["size"], state["ranged"], state["segments"]
+        self.validator = state.get("validator")
+        self.status = "duraklatıldı"
+        return True
+
+    def save_state(self):
+        with self._lock:
+            state = {"url": self.url, "size": self.size, "ranged": self.ranged, "validator": self.validator,
+                     "segments": [list(segment) for segment in self.segments]}
+        temp_path = self.state_path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(temp_path, self.state_path)
+        except OSError as e:
+            print(f"İndirme durumu kaydedilemedi: {e}")
+
+    def _preallocate(self):
+        mode = "r+b" if os.path.exists(self.part_path) else "wb"
+        with open(self.part_path, mode) as f:
+            if self.size and os.fstat(f.fileno()).st_size != self.size:
+                if hasattr(os, "posix_fallocate"):
+                    os.posix_fallocate(f.fileno(), 0, self.size)
+                else:
+                    f.truncate(self.size)
+
+    def start(self, pool, bucket, segment_count):
+        with self._lock:
+            previous = self._thread
+            if previous is not None and previous.is_alive() and self._running:
+                return
+            self._running = True
+            self.status = "indiriliyor"
+            # Duraklatılan önceki çalıştırma hâlâ bitiyor olabilir; yeni iş parçacığı onu bekler
+            self._thread = threading.Thread(target=self._run, args=(pool, bucket, segment_count, previous),
+                                            name="Download", daemon=True)
+            self._thread.start()
+
+    def pause(self):
+        with self._lock:
+            self._running = False
+        self._stop.set()
+
+    def _run(self, pool, bucket, segment_count, previous=None):
+        if previous is not None:
+            previous.join()
+        with self._lock:
+            if not self._running:
+                # Beklerken yeniden duraklatıldı
+                self.status = "duraklatıldı"
+                return
+            self._stop.clear()
+            self.status = "indiriliyor"
+        try:
+            if not self.segments:
+                self._probe()
+                self._plan(segment_count)
+            elif not self.ranged:
+                # Sunucu Range desteklemiyorsa kaldığı yerden devam edilemez, baştan başla
+                self._plan(1)
+            elif not os.path.exists(self.part_path):
+                # İnen veri kaybolmuş; boş bir .part dosyası inmiş sayılmasın diye parçalar baştan alınır
+                with self._lock:
+                    for segment in self.segments:
+                        segment[2] = segment[0]
+            try:
+                self._fetch_all(pool, bucket)
+            except RangeMismatch as e:
+                # Kaldığı yerden devam edilemez: durum atılır, dosya tek parça halinde baştan indirilir
+                print(f"İndirme baştan başlıyor ({self.url}): {e}")
+                with self._lock:
+                    if not self._running:
+                        self.status = "duraklatıldı"
+                        return
+                    self._stop.clear()
+                    self.size, self.ranged, self.validator = None, False, None
+                    self.segments = [[0, None, 0]]
+                if os.path.exists(self.part_path):
+                    os.remove(self.part_path)
+                self._fetch_all(pool, bucket)
+            if self._stop.is_set():
+                self.status = "duraklatıldı"
+                return
+            os.replace(self.part_path, self.path)
+            os.remove(self.state_path)
+            self.status = "tamamlandı"
+        except (OSError, urllib.error.URLError, ValueError) as e:
+            self._stop.set()
+            self.error = str(e)
+            self.status = "hata"
+            self.save_state()
+            print(f"İndirme başarısız ({self.url}): {e}")
+
+    def _fetch_all(self, pool, bucket):
+        self._preallocate()
+        futures = [pool.submit(self._fetch_segment, segment, bucket)
+                   for segment in self.segments if segment[1] is None or segment[2] <= segment[1]]
+        # Parçalar inerken ilerleme saniyede bir diske yazılır (çökme sonrası devam için)
+        while futures:
+            done, pending = concurrent.futures.wait(futures, timeout=1)
+            futures = list(pending)
+            for future in done:
+                if future.exception() is not None:
+                    # Diğer parçalar durdurulup bitmeleri beklenir; yoksa sonraki devam aynı dosyaya
+                    # yazan eski iş parçacıklarıyla yarışır
+                    self._stop.set()
+                    concurrent.futures.wait(futures)
+                    self.save_state()
+                    raise future.exception()
+            self.save_state()
+
+    def _fetch_segment(self, segment, bucket, retries=3):
+        for attempt in range(retries):
+            try:
+                return self._fetch_segment_once(segment, bucket)
+            except (OSError, urllib.error.URLError):
+                if attempt == retries - 1 or self._stop.is_set():
+                    raise
+                time.sleep(2 ** attempt)
+
+    def _fetch_segment_once(self, segment, bucket):
+        start, end, position = segment
+        headers = {}
+        if self.ranged:
+            headers["Range"] = f"bytes={position}-{end}"
+            if self.validator:
+                # Dosya değiştiyse sunucu 206 yerine tüm dosyayı (200) gönderir
+                headers["If-Range"] = self.validator
+        elif position:
+            position = segment[2] = 0
+        with self._request(headers=headers) as response, open(self.part_path, "r+b", buffering=0) as f:
+            if self.ranged:
+                content_range = response.headers.get("Content-Range", "")
+                if response.status != 206 or not content_range.startswith(f"bytes {position}-"):
+                    raise RangeMismatch(f"{position}. bayttan aralık istendi, "
+                                        f"yanıt {response.status} {content_range or '(Content-Range yok)'}")
+            f.seek(position)
+            while not self._stop.is_set():
+                wanted = self.CHUNK_SIZE if end is None else min(self.CHUNK_SIZE, end - position + 1)
+                if wanted <= 0:
+                    break
+                chunk = response.read(wanted)
+                if not chunk:
+                    break
+                bucket.consume(len(chunk))
+                f.write(chunk)
+                position += len(chunk)
+                with self._lock:
+                    segment[2] = position
+        if end is not None and position <= end and not self._stop.is_set():
+            raise OSError(f"Bağlantı erken kapandı ({position}/{end + 1})")
+
+
+class DownloadManager(QObject):
+    # Sayfalardan başlayan indirmeleri (downloadRequested) devralır. http(s) indirmeleri
+    # SegmentedDownload ile ortak bir iş parçacığı havuzunda indirilir; diğerleri (blob:, data:)
+    # ve sayfa kaydetme istekleri Qt'nin kendi indiricisine bırakılır.
+    downloadAdded = pyqtSignal(object)
+
+    def __init__(self, profile, download_dir=None, segments=4, rate_limit_kb=0, max_workers=8):
+        super().__init__(profile)
+        self.profile = profile
+        self.download_dir = download_dir or profile.downloadPath()
+        self.segments = max(1, segments)
+        self.bucket = TokenBucket(rate_limit_kb * 1024)
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                          thread_name_prefix="DownloadSegment")
+        self.downloads = []
+        # Segment istekleri urllib ile yapıldığı için profilin çerezleri burada aynalanır ve her
+        # indirmeye Cookie başlığı olarak eklenir (oturum gerektiren indirmeler için)
+        self._cookies = {}
+        # GET olmayan istekler (ör. form POST'u) urllib ile tekrarlanamaz; bunların indirmeleri Qt'de kalır
+        self._non_get_urls = collections.OrderedDict()
+        self._non_get_lock = threading.Lock()
+        cookie_store = profile.cookieStore()
+        cookie_store.cookieAdded.connect(self._on_cookie_added)
+        cookie_store.cookieRemoved.connect(self._on_cookie_removed)
+        cookie_store.loadAllCookies()
+        profile.downloadRequested.connect(self.handle_request)
+        self._load_incomplete()
+
+    @staticmethod
+    def _cookie_key(cookie):
+        return bytes(cookie.name()), cookie.domain(), cookie.path()
+
+    def _on_cookie_added(self, cookie):
+        self._cookies[self._cookie_key(cookie)] = cookie
+
+    def _on_cookie_removed(self, cookie):
+        self._cookies.pop(self._cookie_key(cookie), None)
+
+    def cookie_header(self, url):
+        url = QUrl(url)
+        host = url.host().lower()
+        path = url.path() or "/"
+        now = QDateTime.currentDateTime()
+        pairs = []
+        for cookie in self._cookies.values():
+            domain = cookie.domain().lower()
+            if domain.startswith("."):
+                if host != domain[1:] and not host.endswith(domain):
+                    continue
+            elif host != domain:
+                continue
+            cookie_path = cookie.path() or "/"
+            if path != cookie_path and not path.startswith(cookie_path.rstrip("/") + "/"):
+                continue
+            if cookie.isSecure() and url.scheme() != "https":
+                continue
+            if not cookie.isSessionCookie() and cookie.expirationDate() < now:
+                continue
+            pairs.append(f"{bytes(cookie.name()).decode('latin-1')}={bytes(cookie.value()).decode('latin-1')}")
+        return "; ".join(pairs)
+
+    def interceptRequest(self, info):
+        # RequestInterceptorChain'den çağrılır; sadece GET olmayan istekleri hatırlar
+        if bytes(info.requestMethod()) == b"GET":
+            return
+        with self._non_get_lock:
+            self._non_get_urls[info.requestUrl().toString()] = True
+            self._non_get_urls.move_to_end(info.requestUrl().toString())
+            while len(self._non_get_urls) > 200:
+                self._non_get_urls.popitem(last=False)
+
+    def _load_incomplete(self):
+        # Önceki çalıştırmadan yarım kalan indirmeler duraklatılmış olarak listelenir
+        pattern = os.path.join(glob.escape(self.download_dir), "*" + SegmentedDownload.STATE_SUFFIX)
+        for state_path in glob.glob(pattern):
+            try:
+                with open(state_path, encoding="utf-8") as f:
+                    url = json.load(f)["url"]
+            except (OSError, ValueError, KeyError):
+                continue
+            download = SegmentedDownload(url, state_path[:-len(SegmentedDownload.STATE_SUFFIX)],
+                                         self.profile.httpUserAgent())
+            if download.load_state():
+                self.downloads.append(download)
+
+    def handle_request(self, item):
+        url = item.url()
+        with self._non_get_lock:
+            non_get = url.toString() in self._non_get_urls
+        if item.isSavePageDownload() or url.scheme() not in ("http", "https") or non_get:
+            item.accept()
+            return
+        file_name = item.downloadFileName() or url.fileName() or "indirme"
+        item.cancel()
+        self.start(url.toString(), os.path.join(self.download_dir, file_name))
+
+    def _unique_path(self, path):
+        base, extension = os.path.splitext(path)
+        counter = 1
+        while os.path.exists(path) or any(d.path == path for d in self.downloads):
+            path = f"{base} ({counter}){extension}"
+            counter += 1
+        return path
+
+    def start(self, url, path):
+        # Aynı URL yarım kalmışsa kaldığı yerden devam edilir
+        for download in self.downloads:
+            if download.url == url and download.status in ("duraklatıldı", "hata"):
+                self.resume(download)
+                return download
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        download = SegmentedDownload(url, self._unique_path(path), self.profile.httpUserAgent())
+        download.cookie_header = self.cookie_header(url)
+        self.downloads.append(download)
+        download.start(self.pool, self.bucket, self.segments)
+        self.downloadAdded.emit(download)
+        return download
+
+    def pause(self, download):
+        download.pause()
+
+    def resume(self, download):
+        # Tamamlanmış ya da zaten inen bir indirme yeniden başlatılmaz
+        if download.status not in ("duraklatıldı", "hata"):
+            return
+        download.error = None
+        download.cookie_header = self.cookie_header(download.url)
+        download.start(self.pool, self.bucket, self.segments)
+
+    def shutdown(self):
+        for download in self.downloads:
+            if download.status == "indiriliyor":
+                download.pause()
+        self.pool.shutdown(wait=False)
+
+
+class DownloadPanel(QDockWidget):
+    # İndirmelerin ilerlemesini ve anlık hızını gösteren yan panel
+    def __init__(self, manager, parent=None):
+        super().__init__("İndirmeler", parent)
+        self.manager = manager
+
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(["Dosya", "İlerleme", "Hız", "Durum"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        pause_button = QPushButton("Duraklat")
+        pause_button.clicked.connect(lambda: self._apply_to_selected(manager.pause))
+        resume_button = QPushButton("Devam")
+        resume_button.clicked.connect(lambda: self._apply_to_selected(manager.resume))
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(pause_button)
+        buttons.addWidget(resume_button)
+        buttons.addStretch()
+        layout = QVBoxLayout()
+        layout.addWidget(self.table)
+        layout.addLayout(buttons)
+        container = QWidget()
+        container.setLayout(layout)
+        self.setWidget(container)
+
+        manager.downloadAdded.connect(lambda download: self.show())
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(500)
+
+    def _apply_to_selected(self, action):
+        for index in self.table.selectionModel().selectedRows():
+            if index.row() < len(self.manager.downloads):
+                action(self.manager.downloads[index.row()])
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+        downloads = self.manager.downloads
+        self.table.setRowCount(len(downloads))
+        for row, download in enumerate(downloads):
+            done = download.bytes_done
+            progress = f"{done / 1024 / 1024:.1f} MB"
+            if download.size:
+                progress = f"%{done * 100 // download.size}  ({progress} / {download.size / 1024 / 1024:.1f} MB)"
+            speed = download.throughput() if download.status == "indiriliyor" else 0
+            status = download.status if not download.error else f"{download.status}: {download.error}"
+            for column, text in enumerate((download.file_name, progress, f"{speed / 1024:.0f} KB/s", status)):
+                item = self.table.item(row, column)
+                if item is None:
+                    self.table.setItem(row, column, QTableWidgetItem(text))
+                else:
+                    item.setText(text)
+
+
+def _archive_compressor():
+    # zstandard kuruluysa daha hızlı açılan zstd, değilse standart kütüphanedeki zlib kullanılır
+    try:
+        import zstandard
+        return "zst", zstandard.ZstdCompressor(level=10).compress
+    except ImportError:
+        return "z", lambda data: zlib.compress(data, 6)
+
+
+def _archive_decompress(codec, data):
+    if codec == "zst":
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class PageArchive(QObject):
+    # Çevrimdışı sayfa arşivi. Sayfalar MHTML olarak kaydedilir, içerik adresli (SHA-256)
+    # ve sıkıştırılmış olarak objects/ altında tutulur; aynı içerik bir kez saklanır.
+    # index.json hangi URL'in hangi nesneye karşılık geldiğini tutar, boyut sınırı aşılınca
+    # en uzun süredir açılmayan nesneler silinir (LRU). cheetares://archive/<hash> kopyayı
+    # mmap ile okuyup view/ altına açar ve yerel dosya olarak yükler: Chromium özel şemadan
+    # gelen multipart/related yanıtını göstermez, indirir; file:// üzerindeki .mhtml'i ise çizer.
+    pageArchived = pyqtSignal(str, str)  # url, hash
+    AUTO_REFRESH = 24 * 3600  # otomatik modda bir sayfa en fazla günde bir yeniden arşivlenir
+
+    def __init__(self, profile, root=None, max_mb=500, auto_visits=0):
+        super().__init__(profile)
+        self.root = root or os.path.join(profile.persistentStoragePath(), "archive")
+        self.max_bytes = max_mb * 1024 * 1024
+        self.auto_visits = auto_visits  # 0 = otomatik arşiv kapalı
+        self.objects_dir = os.path.join(self.root, "objects")
+        self.pending_dir = os.path.join(self.root, "pending")
+        self.view_dir = os.path.join(self.root, "view")
+        self.index_path = os.path.join(self.root, "index.json")
+        self.pages = {}    # url -> {"hash", "title", "saved"}
+        self.objects = {}  # hash -> {"codec", "size", "stored", "last_access"}
+        self._pending = {}  # kaydedilmekte olan MHTML yolu -> (url, başlık)
+        self._lock = threading.Lock()
+        # Sıkıştırma arayüz iş parçacığını bekletmesin diye tek işçili havuzda yapılır
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="PageArchive")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.pending_dir, exist_ok=True)
+        os.makedirs(self.view_dir, exist_ok=True)
+        # Önceki çalıştırmada yarım kalan kayıtlar ve açılmış kopyalar silinir
+        for path in (glob.glob(os.path.join(glob.escape(self.pending_dir), "*.mhtml"))
+                     + glob.glob(os.path.join(glob.escape(self.view_dir), "*.mhtml"))):
+            os.remove(path)
+        self._load_index()
+        profile.downloadRequested.connect(self._on_download_requested)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            self.pages, self.objects = index["pages"], index["objects"]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Arşiv dizini okunamadı: {e}")
+            return
+        # Dosyası silinmiş nesneler dizinden çıkarılır
+        for digest, obj in list(self.objects.items()):
+            if not os.path.exists(self._object_path(digest, obj["codec"])):
+                self._remove_object(digest)
+
+    def _save_index(self):
+        # Kilit tutulurken çağrılmalı
+        temp_path = self.index_path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"pages": self.pages, "objects": self.objects}, f, ensure_ascii=False)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            print(f"Arşiv dizini kaydedilemedi: {e}")
+
+    def _object_path(self, digest, codec):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.mhtml.{codec}")
+
+    def lookup(self, url):
+        entry = self.pages.get(url.toString() if isinstance(url, QUrl) else url)
+        return entry["hash"] if entry else None
+
+    def save_page(self, page):
+        url = page.url()
+        if url.scheme() not in ("http", "https"):
+            return False
+        name = hashlib.sha1(f"{url.toString()} {time.time()}".encode()).hexdigest()
+        path = os.path.normpath(os.path.join(self.pending_dir, name + ".mhtml"))
+        self._pending[path] = (url.toString(), page.title())
+        # Kayıt isteği profilin downloadRequested sinyaline düşer; DownloadManager onu kabul eder
+        page.save(path, QWebEngineDownloadItem.MHTMLSaveFormat)
+        return True
+
+    def auto_save(self, page, visit_count):
+        # Otomatik mod: en az auto_visits kez ziyaret edilen sayfalar yüklendikçe arşivlenir
+        if not self.auto_visits or visit_count < self.auto_visits:
+            return
+        entry = self.pages.get(page.url().toString())
+        if entry is None or time.time() - entry["saved"] >= self.AUTO_REFRESH:
+            self.save_page(page)
+
+    def _on_download_requested(self, item):
+        path = os.path.normpath(os.path.join(item.downloadDirectory(), item.downloadFileName()))
+        if path in self._pending:
+            item.finished.connect(lambda item=item, path=path: self._on_saved(item, path))
+
+    def _on_saved(self, item, path):
+        url, title = self._pending.pop(path)
+        if item.state() != QWebEngineDownloadItem.DownloadCompleted:
+            print(f"Sayfa arşivlenemedi: {url}")
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        self._executor.submit(self._ingest, path, url, title)
+
+    def _ingest(self, path, url, title):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.remove(path)
+            digest = hashlib.sha256(data).hexdigest()
+            with self._lock:
+                known = digest in self.objects
+            if not known:
+                codec, compress = _archive_compressor()
+                blob = compress(data)
+                object_path = self._object_path(digest, codec)
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                with open(object_path + ".tmp", "wb") as f:
+                    f.write(blob)
+                os.replace(object_path + ".tmp", object_path)
+            with self._lock:
+                if not known:
+                    self.objects[digest] = {"codec": codec, "size": len(data), "stored": len(blob),
+                                            "last_access": time.time()}
+                previous = self.pages.get(url)
+                self.pages[url] = {"hash": digest, "title": title, "saved": time.time()}
+                if previous and previous["hash"] != digest:
+                    self._release(previous["hash"])
+                self._evict()
+                self._save_index()
+        except Exception as e:
+            print(f"Sayfa arşivlenemedi ({url}): {e}")
+            return
+        stored = self.objects.get(digest, {}).get("stored", 0)
+        print(f"Sayfa arşivlendi: {url} ({len(data) / 1024:.0f} KB -> {stored / 1024:.0f} KB"
+              f"{', aynı içerik zaten vardı' if known else ''})")
+        self.pageArchived.emit(url, digest)
+
+    def _release(self, digest):
+        # Başka bir URL aynı içeriği kullanmıyorsa nesne silinir
+        if not any(entry["hash"] == digest for entry in self.pages.values()):
+            self._remove_object(digest)
+
+    def _remove_object(self, digest):
+        obj = self.objects.pop(digest, None)
+        if obj is not None:
+            for path in (self._object_path(digest, obj["codec"]), self._view_path(digest)):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        for url in [url for url, entry in self.pages.items() if entry["hash"] == digest]:
+            del self.pages[url]
+
+    def _evict(self):
+        total = sum(obj["stored"] for obj in self.objects.values())
+        if total <= self.max_bytes:
+            return
+        for digest, obj in sorted(self.objects.items(), key=lambda item: item[1]["last_access"]):
+            self._remove_object(digest)
+            total -= obj["stored"]
+            print(f"Arşiv boyut sınırı aşıldı, silindi: {digest[:12]}")
+            if total <= self.max_bytes:
+                break
+
+    def read(self, digest):
+        with self._lock:
+            obj = self.objects.get(digest)
+            if obj is None:
+                return None
+            obj["last_access"] = time.time()
+            self._save_index()
+        # Dosya belleğe eşlenir, sıkıştırma doğrudan eşlenmiş sayfalardan açılır
+        with open(self._object_path(digest, obj["codec"]), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _archive_decompress(obj["codec"], mapped)
+
+    def _view_path(self, digest):
+        return os.path.join(self.view_dir, f"{digest}.mhtml")
+
+    def view_url(self, digest):
+        # Arşivlenmiş kopyayı açılmış bir .mhtml dosyasının file:// adresi olarak döner (yoksa None).
+        # Dosya bu çalıştırma boyunca yeniden kullanılır, kapanıp açılınca silinir.
+        path = self._view_path(digest)
+        if os.path.exists(path):
+            with self._lock:
+                obj = self.objects.get(digest)
+                if obj is None:
+                    return None
+                obj["last_access"] = time.time()
+                self._save_index()
+            return QUrl.fromLocalFile(path)
+        data = self.read(digest)
+        if data is None:
+            return None
+        try:
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"Arşiv kopyası açılamadı ({digest[:12]}): {e}")
+            return None
+        return QUrl.fromLocalFile(path)
+
+    def render_page(self, url):
+        # cheetares://archive arşiv listesi. cheetares://archive/<hash> gezinmeleri BrowserPage'de
+        # view_url'e yönlendirilir; buraya düşerse (ör. iframe) bulunamadı döner.
+        if url.path().strip("/"):
+            return None
+        with self._lock:
+            entries = sorted(self.pages.items(), key=lambda item: -item[1]["saved"])
+            objects = dict(self.objects)
+        rows = "".join(
+            f"<tr><td><a href=\"cheetares://archive/{entry['hash']}\">{html.escape(entry['title'] or url)}</a></td>"
+            f"<td>{html.escape(url[:80])}</td>"
+            f"<td>{time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['saved']))}</td>"
+            f"<td>{objects[entry['hash']]['size'] / 1024:.0f}</td><td>{objects[entry['hash']]['stored'] / 1024:.0f}</td></tr>"
+            for url, entry in entries if entry["hash"] in objects)
+        total = sum(obj["stored"] for obj in objects.values())
+        return _internal_page("Arşiv", f"""<h1>Çevrimdışı arşiv</h1>
+<p>{len(entries)} sayfa, {len(objects)} nesne, {total / 1024 / 1024:.1f} / {self.max_bytes / 1024 / 1024:.0f} MB</p>
+<table><tr><th>Başlık</th><th>URL</th><th>kaydedildi</th><th>boyut (KB)</th><th>diskte (KB)</th></tr>{rows}</table>""")
+
+    def shutdown(self):
+        # Sürmekte olan sıkıştırmalar bitsin, dizin tutarlı kalsın
+        self._executor.shutdown(wait=True)
+
+
 class Bridge(QObject):
     # JavaScript'ten çağrılacak Python fonksiyonları için köprü
+    suggestionsReady = pyqtSignal(str, list)  # ana sayfadaki arama kutusuna: sorgu, öneriler
+
     def __init__(self, browser_instance):
         super().__init__()
         self.browser_instance = browser_instance
@@ -24,25 +2443,585 @@ class Bridge(QObject):
         # Şu an için sadece konsola yazdırıyoruz.
         print(f"HTML'den gelen tema güncellemesi: {theme}")
 
+    @pyqtSlot(str)
+    def reportPerformance(self, report):
+        # Her sayfa yüklemesinden sonra PERF_REPORT_JS tarafından çağrılır
+        try:
+            self.browser_instance.perf_monitor.record(json.loads(report))
+        except ValueError:
+            pass
+
+    @pyqtSlot(str)
+    def speculate(self, url):
+        # Ana sayfadaki bir bağlantının üzerine gelindi (HOME_PAGE_JS)
+        self.browser_instance.speculator.on_hover(QUrl(url))
+
+    @pyqtSlot(str, str)
+    def requestSuggestions(self, engine, text):
+        # Ana sayfanın arama kutusu; sonuç suggestionsReady sinyaliyle döner
+        self.browser_instance.suggestions.request(self, engine, text)
+
+
+class BrowserPage(QWebEnginePage):
+    # tab None ise sayfa henüz bir sekmeye takılmamış gizli bir prerender sayfasıdır
+    _next_page_id = 0
+
+    def __init__(self, browser_instance, parent=None, tab=None):
+        super().__init__(browser_instance.profile, parent)
+        self.browser_instance = browser_instance
+        self.tab = tab
+        BrowserPage._next_page_id += 1
+        self.page_id = BrowserPage._next_page_id
+        # Engellenen ve kaydedilen isteklerin hangi sayfaya ait olduğunu profil yakalayıcısı bilemez
+        handlers = [handler for handler in (browser_instance.request_recorder, browser_instance.content_blocker)
+                    if handler is not None]
+        if handlers and hasattr(self, "setUrlRequestInterceptor"):
+            self.request_interceptor = PageRequestInterceptor(self.page_id, handlers, self)
+            self.setUrlRequestInterceptor(self.request_interceptor)
+
+        # WebChannel kurulumu
+        self.channel = QWebChannel(self)
+        self.channel.registerObject("pyqt", browser_instance.bridge)
+        # Köprü sayfanın kendi betiklerinden ayrı ApplicationWorld'de; sayfalar pyqt'ye erişemez
+        self.setWebChannel(self.channel, QWebEngineScript.ApplicationWorld)
+
+        browser_instance.install_page_scripts(self)
+
+    def acceptNavigationRequest(self, url, navigation_type, is_main_frame):
+        if (is_main_frame and url.scheme() == INTERNAL_SCHEME.decode() and url.host() == "archive"
+                and url.path().strip("/")):
+            # Arşivlenmiş kopya yerel .mhtml dosyası olarak açılır (bkz. PageArchive.view_url)
+            view_url = self.browser_instance.page_archive.view_url(url.path().strip("/"))
+            if view_url is not None:
+                QTimer.singleShot(0, lambda: self.setUrl(view_url))
+                return False
+        # Hedef önceden yüklendiyse gezinme iptal edilir ve hazır sayfa sekmeye takılır
+        if (is_main_frame and self.tab is not None
+                and navigation_type in (QWebEnginePage.NavigationTypeLinkClicked,
+                                        QWebEnginePage.NavigationTypeTyped, QWebEnginePage.NavigationTypeOther)
+                and self.browser_instance.speculator.take(self.tab, url)):
+            return False
+        return super().acceptNavigationRequest(url, navigation_type, is_main_frame)
+
+    def createWindow(self, window_type):
+        if self.tab is None:
+            # Gizli prerender sayfaları açılır pencere açamaz
+            return None
+        if window_type == QWebEnginePage.WebBrowserBackgroundTab:
+            # Arka planda açılan sekme hemen yüklenmesin: motorun açtığı geçici sayfadan
+            # sadece hedef URL'i alıp tembel (lazy) bir sekme oluşturuyoruz.
+            catcher = QWebEnginePage(self.profile(), self)
+            catcher.urlChanged.connect(lambda url: self._open_lazy(catcher, url))
+            return catcher
+        # target="_blank" bağlantıları ve window.open yeni bir ön plan sekmesinde açılır
+        return self.browser_instance.add_tab().page()
+
+    def _open_lazy(self, catcher, url):
+        if url.isEmpty():
+            return
+        catcher.urlChanged.disconnect()
+        catcher.triggerAction(QWebEnginePage.Stop)
+        catcher.deleteLater()
+        self.browser_instance.add_tab(url, background=True)
+
+
+class BrowserTab(QWebEngineView):
+    # Tek bir sekme. Arka planda açılan ya da geri yüklenen sekmeler ilk kez
+    # odaklanana kadar yüklenmez (pending_url'de bekler), uzun süre boşta kalan
+    # sekmeler ise TabLifecycleManager tarafından dondurulup atılır (discard).
+    def __init__(self, browser_instance):
+        super().__init__()
+        self.browser_instance = browser_instance
+        self.pending_url = None
+        self.pending_title = ""
+        self.pending_history = None
+        self.saved_scroll = None
+        self.last_active = time.monotonic()
+        self.load_started_at = None
+        self.last_load_ms = None
+        # Oturum kaydı sadece değişen sekmeleri yeniden serileştirir
+        self.session_dirty = True
+        self.session_state = None
+
+        self.setPage(BrowserPage(browser_instance, self, self))
+
+        self.loadStarted.connect(self._on_load_started)
+        self.loadFinished.connect(self._on_load_finished)
+        self.urlChanged.connect(self._mark_session_dirty)
+        self.titleChanged.connect(self._mark_session_dirty)
+        self.page().scrollPositionChanged.connect(self._mark_session_dirty)
+
+    def _mark_session_dirty(self, *args):
+        self.session_dirty = True
+
+    def set_pending_url(self, url, title="", history=None, scroll=None):
+        # history: QWebEngineHistory'nin serileştirilmiş hali; sekme açılınca geri/ileri geçmişi de döner
+        self.pending_url = QUrl(url)
+        self.pending_title = title or self.pending_url.host() or self.pending_url.toString()
+        self.pending_history = history
+        self.saved_scroll = scroll
+        self.session_dirty = True
+
+    def history_data(self):
+        data = QByteArray()
+        stream = QDataStream(data, QIODevice.WriteOnly)
+        stream << self.page().history()
+        return bytes(data)
+
+    def restore_history(self, data):
+        # Geçmiş geri yüklenince sayfa geçmişteki güncel girdiyi kendiliğinden yükler
+        stream = QDataStream(QByteArray(data), QIODevice.ReadOnly)
+        stream >> self.page().history()
+
+    def can_adopt_page(self):
+        # Prerender sayfası sadece boş ya da ana sayfada duran sekmelere takılır; diğerlerinde
+        # geri/ileri geçmişi kaybolurdu (o durumda prerender yalnızca önbelleği ısıtmış olur)
+        url = self.page().url()
+        return (self.pending_url is None and self.page().history().count() <= 1
+                and (url.isEmpty() or is_home_url(url)))
+
+    def adopt_page(self, page, loading=False, load_started_at=None):
+        # Önceden yüklenmiş sayfa bu sekmenin sayfası olur, eski sayfa silinir
+        old_page = self.page()
+        page.setParent(self)
+        page.tab = self
+        page.setAudioMuted(False)
+        self.blockSignals(True)
+        self.setPage(page)
+        self.blockSignals(False)
+        old_page.deleteLater()
+        page.scrollPositionChanged.connect(self._mark_session_dirty)
+        self.session_dirty = True
+        # setPage sırasında görünümün sinyalleri susturuldu; adres ve başlık değişimi bir kez bildirilir
+        self.urlChanged.emit(self.url())
+        self.titleChanged.emit(self.title())
+        if loading:
+            self.load_started_at = load_started_at
+        else:
+            self.last_load_ms = 0.0
+            self.browser_instance.on_tab_load_finished(self, True)
+
+    def target_url(self):
+        # Henüz yüklenmemiş sekmelerde gideceği adresi, diğerlerinde mevcut adresi döndürür.
+        return self.pending_url if self.pending_url is not None else self.url()
+
+    def display_title(self):
+        if self.pending_url is not None:
+            return self.pending_title
+        return self.title() or self.url().toString()
+
+    def lifecycle_state(self):
+        if self.pending_url is not None:
+            return "unloaded"
+        state = self.page().lifecycleState()
+        if state == QWebEnginePage.LifecycleState.Frozen:
+            return "frozen"
+        if state == QWebEnginePage.LifecycleState.Discarded:
+            return "discarded"
+        return "active"
+
+    def activate(self):
+        self.last_active = time.monotonic()
+        if self.pending_url is not None:
+            url, self.pending_url = self.pending_url, None
+            history, self.pending_history = self.pending_history, None
+            if history:
+                self.restore_history(history)
+            else:
+                self.setUrl(url)
+        elif self.page().lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            # Atılmış (discarded) sayfa Active'e dönünce Chromium aynı URL'i yeniden yükler.
+            self.page().setLifecycleState(QWebEnginePage.LifecycleState.Active)
+
+    def _lifecycle_allows(self, state):
+        # Chromium'un önerdiği durum sesi, oynayan medyayı, kaydedilmemiş form girdisini ve
+        # beforeunload'u hesaba katar; sekme önerilenden daha ileri bir duruma götürülmez.
+        # Ses çalan sekmeler ayrıca hiç dondurulmaz ya da atılmaz.
+        page = self.page()
+        if page.isAudible():
+            return False
+        order = (QWebEnginePage.LifecycleState.Active, QWebEnginePage.LifecycleState.Frozen,
+                 QWebEnginePage.LifecycleState.Discarded)
+        return order.index(state) <= order.index(page.recommendedState())
+
+    def freeze(self):
+        # Görünür sayfalar dondurulamaz, sadece arka plandaki sekmeler için çağrılmalı.
+        if (self.pending_url is None and self.page().lifecycleState() == QWebEnginePage.LifecycleState.Active
+                and self._lifecycle_allows(QWebEnginePage.LifecycleState.Frozen)):
+            self.page().setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+
+    def discard(self):
+        # Sekme atıldıysa True döner
+        if self.pending_url is not None or self.lifecycle_state() == "discarded":
+            return False
+        if not self._lifecycle_allows(QWebEnginePage.LifecycleState.Discarded):
+            return False
+        # Sekme yeniden açıldığında kaldığı yere dönebilmek için kaydırma konumunu saklıyoruz.
+        self.saved_scroll = self.page().scrollPosition()
+        self.page().setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+        return True
+
+    def memory_kb(self):
+        if self.pending_url is not None or self.lifecycle_state() == "discarded":
+            return 0
+        return _process_rss_kb(self.page().renderProcessPid())
+
+    def _on_load_started(self):
+        self.load_started_at = time.perf_counter()
+
+    def _on_load_finished(self, ok):
+        if self.load_started_at is not None:
+            # Sıcak (önbellekten) ve soğuk yüklemeleri karşılaştırmak için yükleme süresi
+            self.last_load_ms = (time.perf_counter() - self.load_started_at) * 1000
+            self.load_started_at = None
+        if ok and self.saved_scroll is not None:
+            x, y = self.saved_scroll.x(), self.saved_scroll.y()
+            self.saved_scroll = None
+            self.page().runJavaScript(f"window.scrollTo({x}, {y});")
+        self.browser_instance.on_tab_load_finished(self, ok)
+
+
+class SessionManager(QObject):
+    # Açık sekmelerin (URL, başlık, kaydırma konumu ve serileştirilmiş geri/ileri geçmişi)
+    # düzenli aralıklarla kaydedilmesi. Sadece değişen sekmeler yeniden serileştirilir ve dosya
+    # sadece içerik değiştiyse geçici dosya + os.replace ile atomik olarak yazılır.
+    VERSION = 1
+
+    def __init__(self, browser_instance, path, interval=10):
+        super().__init__(browser_instance)
+        self.browser_instance = browser_instance
+        self.path = path
+        self._last_written = None
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.save)
+        self.timer.start(interval * 1000)
+
+    def has_session(self):
+        return os.path.exists(self.path)
+
+    @staticmethod
+    def _tab_state(tab):
+        if tab.pending_url is not None:
+            scroll = tab.saved_scroll
+            history = tab.pending_history
+            url, title = tab.pending_url.toString(), tab.pending_title
+        else:
+            scroll = tab.page().scrollPosition()
+            history = tab.history_data()
+            url, title = tab.url().toString(), tab.title()
+        return {
+            "url": url,
+            "title": title,
+            "scroll": [scroll.x(), scroll.y()] if scroll is not None else None,
+            "history": base64.b64encode(history).decode("ascii") if history else None,
+        }
+
+    def snapshot(self):
+        tabs = []
+        for tab in self.browser_instance.tabs():
+            if tab.session_dirty or tab.session_state is None:
+                tab.session_state = self._tab_state(tab)
+                tab.session_dirty = False
+            tabs.append(tab.session_state)
+        return {"version": self.VERSION, "current": self.browser_instance.tab_widget.currentIndex(), "tabs": tabs}
+
+    def save(self):
+        document = json.dumps(self.snapshot(), ensure_ascii=False)
+        if document == self._last_written:
+            return
+        temp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(document)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self._last_written = document
+        except OSError as e:
+            print(f"Oturum kaydedilemedi: {e}")
+
+    def restore(self):
+        # Sadece ön plandaki sekme yüklenir; diğerleri ilk görüntülendiklerinde yüklenen
+        # yer tutuculardır, böylece 30 sekmelik oturum tek sayfa açmak kadar sürer.
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                session = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Oturum okunamadı: {e}")
+            return False
+        entries = session.get("tabs") or []
+        if session.get("version") != self.VERSION or not entries:
+            return False
+
+        current = min(max(session.get("current", 0), 0), len(entries) - 1)
+        tab_widget = self.browser_instance.tab_widget
+        # İlk eklenen sekme otomatik olarak seçili olur; yüklenmesin diye sinyaller geçici olarak kapalı
+        tab_widget.blockSignals(True)
+        try:
+            for entry in entries:
+                history = base64.b64decode(entry["history"]) if entry.get("history") else None
+                scroll = QPointF(*entry["scroll"]) if entry.get("scroll") else None
+                self.browser_instance.add_tab(entry["url"], background=True, title=entry.get("title", ""),
+                                              history=history, scroll=scroll)
+            tab_widget.setCurrentIndex(current)
+        finally:
+            tab_widget.blockSignals(False)
+        # Ön plan sekmesi activate() ile geçmişiyle birlikte yüklenir
+        self.browser_instance._on_current_tab_changed(current)
+        return True
+
+
+class TabLifecycleManager(QObject):
+    # Arka plandaki sekmeleri belirli bir süre boşta kaldıktan sonra önce dondurur
+    # (Frozen: JS ve zamanlayıcılar durur), daha uzun süre sonra ya da süreç bellek
+    # bütçesini aştığında atar (Discarded: renderer belleği serbest kalır). Sekme sadece
+    # Chromium'un recommendedState() ile izin verdiği duruma geçirilir.
+    def __init__(self, browser_instance, freeze_after=5 * 60, discard_after=30 * 60,
+                 memory_budget_mb=1024, check_interval=30):
+        super().__init__(browser_instance)
+        self.browser_instance = browser_instance
+        self.freeze_after = freeze_after
+        self.discard_after = discard_after
+        self.memory_budget_mb = memory_budget_mb
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+        self.timer.start(check_interval * 1000)
+
+    def background_tabs(self):
+        current = self.browser_instance.tab_widget.currentWidget()
+        return [tab for tab in self.browser_instance.tabs() if tab is not current]
+
+    def check(self):
+        now = time.monotonic()
+        for tab in self.background_tabs():
+            idle = now - tab.last_active
+            if idle >= self.discard_after and tab.discard():
+                continue
+            # Atılamayan sekme (ör. kaydedilmemiş form) hiç değilse dondurulmayı dener
+            if idle >= self.freeze_after:
+                tab.freeze()
+
+        if self.memory_budget_mb:
+            self._enforce_memory_budget()
+        self.browser_instance.update_tab_tooltips()
+
+    def _enforce_memory_budget(self):
+        budget_kb = self.memory_budget_mb * 1024
+        total_kb = self.browser_instance.total_memory_kb()
+        if total_kb <= budget_kb:
+            return
+        # En uzun süredir kullanılmayan sekmeden başlayarak bütçenin altına inene kadar at.
+        candidates = [tab for tab in self.background_tabs() if tab.lifecycle_state() in ("active", "frozen")]
+        candidates.sort(key=lambda tab: tab.last_active)
+        for tab in candidates:
+            pid = tab.page().renderProcessPid()
+            shared = any(other is not tab and other.lifecycle_state() in ("active", "frozen")
+                         and other.page().renderProcessPid() == pid
+                         for other in self.browser_instance.tabs())
+            freed_kb = 0 if shared else (tab.memory_kb() or 0)
+            if not tab.discard():
+                # Ses çalıyor ya da kaydedilmemiş girdi var; Chromium atılmasını önermiyor
+                continue
+            print(f"Bellek bütçesi aşıldı, sekme atıldı: {tab.display_title()}")
+            total_kb -= freed_kb
+            if total_kb <= budget_kb:
+                break
+
+
+class Speculator(QObject):
+    # Kullanıcı gezinmeden önce bağlantıları hazırlar (preconnect / dns-prefetch) ve en olası
+    # hedefi gizli bir sayfada önceden yükler (prerender). Gezinme o adrese giderse hazır sayfa
+    # sekmeye takılır. Eşzamanlı prerender sayısı ve prerender başına bellek sınırlıdır.
+    PRECONNECT_TTL = 30     # aynı origin'e bu süre içinde yeniden preconnect yapılmaz (sn)
+    PRECONNECT_LINKS = 16   # gizli sayfada tutulan en fazla link etiketi
+    PRERENDER_TTL = 60      # kullanılmayan prerender bu süre sonunda atılır (sn)
+    OMNIBOX_DELAY = 300     # yazma sürerken prerender başlatılmaz (ms)
+
+    def __init__(self, browser_instance, enabled=True, max_prerenders=1, memory_budget_mb=200):
+        super().__init__(browser_instance)
+        self.browser_instance = browser_instance
+        self.enabled = enabled
+        self.max_prerenders = max_prerenders
+        self.memory_budget_kb = memory_budget_mb * 1024
+        self.stats = browser_instance.perf_monitor.speculation
+        self.prerenders = collections.OrderedDict()  # anahtar -> {"page", "started", "load_ms"}
+        self._preconnected = {}
+        self._preconnect_page = None
+        self._preconnect_queue = []
+        self._omnibox_candidate = None
+
+        self._omnibox_timer = QTimer(self)
+        self._omnibox_timer.setSingleShot(True)
+        self._omnibox_timer.setInterval(self.OMNIBOX_DELAY)
+        self._omnibox_timer.timeout.connect(self._prerender_omnibox_candidate)
+        self._expire_timer = QTimer(self)
+        self._expire_timer.timeout.connect(self._expire)
+        self._expire_timer.start(10 * 1000)
+
+    @staticmethod
+    def _key(url):
+        url = QUrl(url).adjusted(QUrl.RemoveFragment | QUrl.StripTrailingSlash)
+        if url.path() == "/":
+            url.setPath("")
+        return url.toString()
+
+    def preconnect(self, url):
+        url = QUrl(url)
+        if not self.enabled or url.scheme() not in ("http", "https"):
+            return
+        origin = url.adjusted(QUrl.RemoveUserInfo | QUrl.RemovePath | QUrl.RemoveQuery | QUrl.RemoveFragment).toString()
+        now = time.monotonic()
+        if now - self._preconnected.get(origin, -self.PRECONNECT_TTL) < self.PRECONNECT_TTL:
+            return
+        self._preconnected[origin] = now
+        self.stats["preconnects"] += 1
+        if self._preconnect_page is None:
+            # Bağlantılar profilin ağ servisinde açılır, gezinme aynı soketleri kullanır
+            self._preconnect_page = QWebEnginePage(self.browser_instance.profile, self)
+            self._preconnect_page.loadFinished.connect(self._on_preconnect_page_ready)
+            self._preconnect_page.setHtml("<!DOCTYPE html><html><head></head><body></body></html>")
+        if self._preconnect_queue is not None:
+            self._preconnect_queue.append(origin)
+            return
+        self._preconnect_page.runJavaScript(PRECONNECT_JS % (self.PRECONNECT_LINKS, json.dumps(origin)))
+
+    def _on_preconnect_page_ready(self, ok):
+        queued, self._preconnect_queue = self._preconnect_queue or [], None
+        for origin in queued:
+            self._preconnect_page.runJavaScript(PRECONNECT_JS % (self.PRECONNECT_LINKS, json.dumps(origin)))
+
+    def prerender(self, url):
+        url = QUrl(url)
+        key = self._key(url)
+        if (not self.enabled or self.max_prerenders <= 0 or url.scheme() not in ("http", "https")
+                or key in self.prerenders):
+            return
+        while len(self.prerenders) >= self.max_prerenders:
+            # En eski tahmin yerini yenisine bırakır
+            _, entry = self.prerenders.popitem(last=False)
+            self._drop(entry)
+        page = BrowserPage(self.browser_instance, self)
+        page.setAudioMuted(True)
+        entry = {"page": page, "started": time.perf_counter(), "load_ms": None}
+        page.loadFinished.connect(lambda ok, key=key, entry=entry: self._on_prerender_finished(key, entry, ok))
+        self.prerenders[key] = entry
+        self.stats["prerenders"] += 1
+        page.setUrl(url)
+
+    def _on_prerender_finished(self, key, entry, ok):
+        if self.prerenders.get(key) is not entry or entry["load_ms"] is not None:
+            return
+        if not ok:
+            del self.prerenders[key]
+            self.stats["failed"] += 1
+            entry["page"].deleteLater()
+            return
+        entry["load_ms"] = (time.perf_counter() - entry["started"]) * 1000
+        # Process-per-site ile renderer başka sekmelerle paylaşılıyor olabilir; o zaman ölçüm üst sınırdır
+        memory = _process_rss_kb(entry["page"].renderProcessPid()) or 0
+        if memory > self.memory_budget_kb:
+            print(f"Prerender bellek bütçesini aştı, atıldı: {key} ({memory / 1024:.0f} MB)")
+            del self.prerenders[key]
+            self._drop(entry)
+
+    def _drop(self, entry):
+        self.stats["misses"] += 1
+        entry["page"].deleteLater()
+
+    def take(self, tab, url):
+        # BrowserPage.acceptNavigationRequest'ten çağrılır; True dönerse gezinme iptal edilmeli
+        key = self._key(url)
+        entry = self.prerenders.get(key)
+        if entry is None or not tab.can_adopt_page():
+            return False
+        del self.prerenders[key]
+        loading = entry["load_ms"] is None
+        saved_ms = (time.perf_counter() - entry["started"]) * 1000 if loading else entry["load_ms"]
+        self.stats["hits"] += 1
+        self.stats["saved_ms"] += saved_ms
+        print(f"Prerender kullanıldı: {key} (~{saved_ms:.0f} ms kazanıldı)")
+        # Sekmenin sayfası, kendi acceptNavigationRequest çağrısı bitmeden değiştirilemez
+        QTimer.singleShot(0, lambda: tab.adopt_page(entry["page"], loading, entry["started"]))
+        return True
+
+    def on_hover(self, url):
+        # Ana sayfadaki hızlı bağlantılar az ve seçilmiş olduğu için üzerine gelmek güçlü bir işarettir
+        self.preconnect(url)
+        self.prerender(url)
+
+    def on_omnibox_input(self, text, hosts):
+        # hosts: daha önce görülen hostlardan tamamlama önerileri (sıklık sırasıyla)
+        for host in hosts[:2]:
+            self.preconnect(address_url(host))
+        self._omnibox_candidate = hosts[0] if hosts and len(text) >= 3 else None
+        self._omnibox_timer.start()
+
+    def _prerender_omnibox_candidate(self):
+        if self._omnibox_candidate:
+            # navigate_to_url ile aynı adres, yoksa önceden yüklenen sayfa kullanılamaz
+            self.prerender(address_url(self._omnibox_candidate))
+
+    def clear(self):
+        while self.prerenders:
+            _, entry = self.prerenders.popitem(last=False)
+            self._drop(entry)
+
+    def _expire(self):
+        now = time.monotonic()
+        for origin, at in list(self._preconnected.items()):
+            if now - at >= self.PRECONNECT_TTL:
+                del self._preconnected[origin]
+        deadline = time.perf_counter() - self.PRERENDER_TTL
+        for key, entry in list(self.prerenders.items()):
+            if entry["started"] < deadline:
+                del self.prerenders[key]
+                self._drop(entry)
+
+
 class WebBrowser(QMainWindow):
-    def __init__(self):
+    def __init__(self, profile=None, history=None, content_blocker=None, perf_monitor=None, download_manager=None,
+                 page_archive=None, request_recorder=None, suggestions=None, restore_session=False,
+                 save_session=True, speculation=None):
         super().__init__()
 
+        # Tüm sekmeler aynı kalıcı profili paylaşır
+        self.profile = profile or create_profile(parse_args([]))
+        self.history = history or HistoryStore(os.path.join(self.profile.persistentStoragePath(), "history.sqlite"))
+        self.content_blocker = content_blocker
+        self.perf_monitor = perf_monitor or PerfMonitor()
+        self.download_manager = download_manager or DownloadManager(self.profile)
+        self.page_archive = page_archive or PageArchive(self.profile)
+        self.request_recorder = request_recorder
+        self.suggestions = suggestions or SuggestionService(
+            {engine: OpenSearchSuggestions(url, self.profile.httpUserAgent())
+             for engine, url in DEFAULT_SUGGEST_URLS.items()}, self.history)
+
         self.setWindowTitle("Cheetares Web Browser")
         self.setGeometry(100, 100, 1200, 800)
         
-        # Sadece pencere ikonu (cheetares.png) ve HTML logosu (cheetares_logo.svg) için varlık kontrolü
-        self._ensure_assets_exist() 
-        self.setWindowIcon(QIcon('cheetares.png'))
+        # Pencere ikonu da ana sayfa dosyalarıyla birlikte bellekten gelir, diske bir şey yazılmaz
+        self.scheme_handler = self.profile.urlSchemeHandler(INTERNAL_SCHEME)
+        self.scheme_handler.add_page("perf", self.perf_monitor.render_page)
+        self.scheme_handler.add_page("processes", render_process_page)
+        self.scheme_handler.add_page("archive", self.page_archive.render_page)
+        self._install_profile_scripts()
+        icon_pixmap = QPixmap()
+        icon_pixmap.loadFromData(self.scheme_handler.static.get(("home", "/cheetares_logo.png"), (None, b""))[1])
+        self.setWindowIcon(QIcon(icon_pixmap))
         
-        self.browser = QWebEngineView()
-        self.setCentralWidget(self.browser)
-
-        # WebChannel kurulumu
-        self.channel = QWebChannel(self.browser.page())
         self.bridge = Bridge(self)
-        self.channel.registerObject("pyqt", self.bridge)
-        self.browser.page().setWebChannel(self.channel)
+
+        # Her sekme kendi QWebEngineView'ine sahip, tek pencerede birden çok sayfa açılabilir
+        self.tab_widget = QTabWidget()
+        self.tab_widget.setDocumentMode(True)
+        self.tab_widget.setTabsClosable(True)
+        self.tab_widget.setMovable(True)
+        self.tab_widget.currentChanged.connect(self._on_current_tab_changed)
+        self.tab_widget.tabCloseRequested.connect(self.close_tab)
+        self.setCentralWidget(self.tab_widget)
 
         self.navigation_bar = QToolBar("Gezinme Çubuğu")
         self.addToolBar(Qt.TopToolBarArea, self.navigation_bar)
@@ -53,17 +3032,17 @@ class WebBrowser(QMainWindow):
         # Butonlar için QAction'lar, objectName ile CSS tarafından hedeflenecek
         back_action = QAction("Geri", self)
         back_action.setObjectName("backButton")
-        back_action.triggered.connect(self.browser.back)
+        back_action.triggered.connect(lambda: self.browser.back())
         self.navigation_bar.addAction(back_action)
 
         forward_action = QAction("İleri", self)
         forward_action.setObjectName("forwardButton")
-        forward_action.triggered.connect(self.browser.forward)
+        forward_action.triggered.connect(lambda: self.browser.forward())
         self.navigation_bar.addAction(forward_action)
 
         reload_action = QAction("Yenile", self)
         reload_action.setObjectName("reloadButton")
-        reload_action.triggered.connect(self.browser.reload)
+        reload_action.triggered.connect(lambda: self.browser.reload())
         self.navigation_bar.addAction(reload_action)
 
         home_action = QAction("Ana Sayfa", self)
@@ -71,6 +3050,17 @@ class WebBrowser(QMainWindow):
         home_action.triggered.connect(self.go_home)
         self.navigation_bar.addAction(home_action)
 
+        new_tab_action = QAction("Yeni Sekme", self)
+        new_tab_action.setObjectName("newTabButton")
+        new_tab_action.setShortcut(QKeySequence.AddTab)
+        new_tab_action.triggered.connect(self.open_new_tab)
+        self.navigation_bar.addAction(new_tab_action)
+
+        close_tab_action = QAction("Sekmeyi Kapat", self)
+        close_tab_action.setShortcut(QKeySequence.Close)
+        close_tab_action.triggered.connect(lambda: self.close_tab(self.tab_widget.currentIndex()))
+        self.addAction(close_tab_action)
+
         self.navigation_bar.addSeparator()
 
         self.url_bar = QLineEdit()
@@ -78,6 +3068,18 @@ class WebBrowser(QMainWindow):
         self.url_bar.setFont(QFont("Segoe UI", 10))
         self.url_bar.setPlaceholderText("Web adresini girin veya arama yapın...")
         self.navigation_bar.addWidget(self.url_bar)
+
+        # Adres çubuğu tamamlaması: öneriler her tuş vuruşunda bellekteki indeksten gelir,
+        # QCompleter kendi filtrelemesini yapmaz (sıralama frecency'ye göre).
+        self.completion_index = CompletionIndex()
+        self.completion_model = QStringListModel(self)
+        self.url_completer = QCompleter(self.completion_model, self)
+        self.url_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.url_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.url_completer.setWidget(self.url_bar)
+        self.url_completer.activated[str].connect(self._on_completion_activated)
+        self.suggestions.suggestionsReady.connect(self._on_suggestions_ready)
+        self.url_bar.textEdited.connect(self._update_completions)
         
         self.navigation_bar.addSeparator()
 
@@ -85,6 +3087,12 @@ class WebBrowser(QMainWindow):
         settings_action.setObjectName("themeButton")
         settings_action.triggered.connect(self.toggle_theme)
         self.navigation_bar.addAction(settings_action)
+
+        web_dark_action = QAction("Web Karanlık Mod", self)
+        web_dark_action.setObjectName("webDarkButton")
+        web_dark_action.setCheckable(True)
+        web_dark_action.toggled.connect(self.toggle_web_dark_mode)
+        self.navigation_bar.addAction(web_dark_action)
         
         # Arama motoru butonu, artık HTML sayfasındaki seçimi etkileyecek
         self.search_engine_button = QPushButton("Google") # Başlangıçta Google göster
@@ -94,10 +3102,52 @@ class WebBrowser(QMainWindow):
         self.search_engine_button.setFont(QFont("Segoe UI", 9))
         self.navigation_bar.addWidget(self.search_engine_button)
 
-        self.browser.urlChanged.connect(self.update_url_bar)
-        self.browser.titleChanged.connect(self.setWindowTitle)
+        memory_action = QAction("Bellek", self)
+        memory_action.setObjectName("memoryButton")
+        memory_action.triggered.connect(self.show_memory_report)
+        self.navigation_bar.addAction(memory_action)
+
+        perf_action = QAction("Performans", self)
+        perf_action.setObjectName("perfButton")
+        perf_action.triggered.connect(lambda: self.add_tab(QUrl("cheetares://perf")))
+        self.navigation_bar.addAction(perf_action)
+
+        save_offline_action = QAction("Çevrimdışı Kaydet", self)
+        save_offline_action.setObjectName("saveOfflineButton")
+        save_offline_action.setShortcut(QKeySequence.Save)
+        save_offline_action.triggered.connect(self.save_offline)
+        self.navigation_bar.addAction(save_offline_action)
+
+        archive_action = QAction("Arşiv", self)
+        archive_action.setObjectName("archiveButton")
+        archive_action.triggered.connect(self.open_archive)
+        self.navigation_bar.addAction(archive_action)
+        self.page_archive.pageArchived.connect(self._on_page_archived)
+
+        if self.request_recorder is not None:
+            self.request_log_action = QAction("İstek Kaydı", self)
+            self.request_log_action.setObjectName("requestLogButton")
+            self.request_log_action.setCheckable(True)
+            self.request_log_action.setChecked(self.request_recorder.enabled)
+            self.request_log_action.toggled.connect(self.toggle_request_log)
+            self.navigation_bar.addAction(self.request_log_action)
+
+            har_action = QAction("HAR", self)
+            har_action.setObjectName("harButton")
+            har_action.setToolTip("Bu sayfanın isteklerini HAR olarak dışa aktar")
+            har_action.triggered.connect(self.export_har)
+            self.navigation_bar.addAction(har_action)
+
+        self.download_panel = DownloadPanel(self.download_manager, self)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.download_panel)
+        self.download_panel.hide()
+        downloads_action = self.download_panel.toggleViewAction()
+        downloads_action.setObjectName("downloadsButton")
+        self.navigation_bar.addAction(downloads_action)
 
+        self.theme_registry = ThemeRegistry(os.path.join(self.profile.persistentStoragePath(), "themes"))
         self.current_theme = "light"
+        self.web_dark_mode = False
 
         self.search_engines = [
             ("Google", "https://www.google.com/search?q="),
@@ -106,59 +3156,364 @@ class WebBrowser(QMainWindow):
         ]
         self.current_engine_index = 0
         
-        self.home_page_path = os.path.abspath("index.html")
-        
+        self.lifecycle_manager = TabLifecycleManager(self)
+        # speculation: Speculator ayarları (enabled, max_prerenders, memory_budget_mb)
+        self.speculation = speculation or {}
+        self.speculator = Speculator(self, **self.speculation)
+        self._load_completion_sources()
+
         self.apply_theme() # QSS teması uygulandı
-        self.go_home() # HTML ana sayfası yüklendi
-
-    def _ensure_assets_exist(self):
-        # Pencere ikonu için PNG
-        window_icon_name = 'cheetares.png'
-        if not os.path.exists(window_icon_name):
-            pixmap = QPixmap(32, 32)
-            pixmap.fill(Qt.transparent) # Şeffaf bir placeholder
-            pixmap.save(window_icon_name)
-            print(f"{window_icon_name} bulunamadı, boş bir placeholder oluşturuldu.")
-        
-        # HTML ana sayfası için SVG logo
-        html_logo_name = 'cheetares_logo.svg'
-        if not os.path.exists(html_logo_name):
-            print(f"{html_logo_name} bulunamadı. Lütfen elle bir SVG logo dosyası oluşturun ve bu dizine yerleştirin.")
-            # Boş bir SVG dosyası oluşturmak, çoğu zaman işe yaramaz.
-            # Ancak uygulamanın çökmesini engellemek için minimum bir SVG yazılabilir.
-            with open(html_logo_name, 'w') as f:
-                f.write('<svg width="150" height="150" viewBox="0 0 150 150" xmlns="http://www.w3.org/2000/svg"><rect width="100%" height="100%" fill="none"/></svg>')
 
+        # Oturum dosyasını yalnızca ilk pencere yazar; sonradan açılan pencereler geçicidir
+        self.child_windows = []
+        self.session_manager = None
+        if save_session:
+            self.session_manager = SessionManager(self, os.path.join(self.profile.persistentStoragePath(), "session.json"))
+        if not (restore_session and self.session_manager and self.session_manager.has_session()
+                and self.session_manager.restore()):
+            self.add_tab() # İlk sekme
+            self.go_home() # HTML ana sayfası yüklendi
+
+    @property
+    def browser(self):
+        # Geriye dönük uyumluluk: self.browser her zaman etkin sekmenin görünümünü verir
+        return self.tab_widget.currentWidget()
+
+    def tabs(self):
+        return [self.tab_widget.widget(i) for i in range(self.tab_widget.count())]
+
+    def add_tab(self, url=None, background=False, title="", history=None, scroll=None):
+        tab = BrowserTab(self)
+        tab.urlChanged.connect(lambda q, tab=tab: self._on_tab_url_changed(tab, q))
+        tab.titleChanged.connect(lambda title, tab=tab: self._on_tab_title_changed(tab, title))
+
+        if url is not None and background:
+            # Arka plan sekmesi: ilk odaklanana kadar ağ isteği ya da renderer yok
+            tab.set_pending_url(url, title, history, scroll)
+        elif url is not None:
+            tab.setUrl(QUrl(url))
+
+        index = self.tab_widget.addTab(tab, tab.display_title() or "Yeni Sekme")
+        if not background:
+            self.tab_widget.setCurrentIndex(index)
+        return tab
+
+    def open_new_tab(self):
+        self.add_tab()
+        self.go_home()
+
+    def open_urls(self, urls):
+        # Komut satırından ya da başka bir açılıştan gelen adresler; henüz kullanılmamış ana sayfa sekmesi yeniden kullanılır
+        for url in urls:
+            tab = self.browser
+            if (self.tab_widget.count() == 1 and tab is not None and not tab.history().canGoBack()
+                    and (tab.url().isEmpty() or is_home_url(tab.url()))):
+                tab.setUrl(QUrl(url))
+            else:
+                self.add_tab(url)
+
+    def new_window(self, urls=()):
+        # Yeni pencere profili, geçmişi, içerik engelleyiciyi, ölçümleri ve indirmeleri bu pencereyle paylaşır
+        window = WebBrowser(self.profile, self.history, self.content_blocker, self.perf_monitor,
+                            self.download_manager, self.page_archive, self.request_recorder, self.suggestions,
+                            save_session=False, speculation=self.speculation)
+        window.setAttribute(Qt.WA_DeleteOnClose)
+        window.destroyed.connect(lambda _=None, window=window: self.child_windows.remove(window))
+        self.child_windows.append(window)
+        window.open_urls(urls)
+        window.show()
+        return window
+
+    def handle_launch_request(self, urls, new_window):
+        # İkinci bir açılış adreslerini bu sürece devretti
+        if new_window:
+            target = self.new_window(urls)
+        else:
+            target = self
+            if urls:
+                self.open_urls(urls)
+            else:
+                self.open_new_tab()
+            self.show()
+        if target.isMinimized():
+            target.showNormal()
+        target.raise_()
+        target.activateWindow()
+
+    def closeEvent(self, event):
+        if self.session_manager:
+            self.session_manager.save()
+        super().closeEvent(event)
+
+    def close_tab(self, index):
+        if self.tab_widget.count() <= 1:
+            self.close()
+            return
+        tab = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        tab.deleteLater()
+
+    def _on_current_tab_changed(self, index):
+        tab = self.tab_widget.widget(index)
+        if tab is None:
+            return
+        tab.activate()
+        self.update_url_bar(tab.target_url())
+        self.setWindowTitle(tab.display_title() or "Cheetares Web Browser")
+
+    def _on_tab_url_changed(self, tab, q):
+        if tab is self.browser:
+            self.update_url_bar(q)
+        if q.scheme() in ("http", "https"):
+            # urlChanged anında tab.title() hâlâ önceki sayfanındır; başlık titleChanged ve
+            # loadFinished'te bu adres için yazılır, boş başlık sayfanın eski başlığını silmez
+            self.history.add_visit(q.toString(), "", q.host())
+            self.completion_index.record_visit(q.host())
+
+    def _on_tab_title_changed(self, tab, title):
+        url = tab.url()
+        if url.scheme() in ("http", "https") and title:
+            self.history.update_title(url.toString(), title)
+        index = self.tab_widget.indexOf(tab)
+        if index >= 0:
+            self.tab_widget.setTabText(index, title[:30] or "Yeni Sekme")
+        if tab is self.browser:
+            self.setWindowTitle(title)
+
+    def on_tab_load_finished(self, tab, ok):
+        if ok and tab.last_load_ms is not None and tab.url().scheme() in ("http", "https"):
+            message = f"Yüklendi: {tab.last_load_ms:.0f} ms"
+            if self.content_blocker is not None:
+                blocked, saved = self.content_blocker.page_stats(tab.page())
+                if blocked:
+                    message += f", {blocked} istek engellendi (~{saved / 1024:.0f} KB tasarruf)"
+            print(f"Sayfa yüklendi: {tab.url().host()} ({message})")
+            if tab is self.browser:
+                self.statusBar().showMessage(message, 5000)
+        if is_home_url(tab.url()) and not ok:
+            print("Ana sayfa yüklenirken bir hata oluştu.")
+        if tab.url().scheme() in ("http", "https"):
+            if ok and tab.title():
+                # Başlık sayfa adresi değişmeden önce geldiyse kaydedilmemiş olabilir
+                self.history.update_title(tab.url().toString(), tab.title())
+            if ok and self.page_archive.auto_visits:
+                self.page_archive.auto_save(tab.page(), self.history.visit_count(tab.url().toString()))
+            elif not ok and tab is self.browser and self.page_archive.lookup(tab.url()):
+                self.statusBar().showMessage("Sayfa yüklenemedi; çevrimdışı kopyası için Arşiv'e tıklayın", 10000)
+
+    def save_offline(self):
+        if self.page_archive.save_page(self.browser.page()):
+            self.statusBar().showMessage("Sayfa çevrimdışı arşive kaydediliyor...", 3000)
+        else:
+            self.statusBar().showMessage("Sadece http(s) sayfaları arşivlenebilir", 3000)
+
+    def open_archive(self):
+        # Etkin sayfanın arşivlenmiş kopyası varsa o, yoksa arşiv listesi açılır
+        digest = self.page_archive.lookup(self.browser.url())
+        self.add_tab(QUrl(f"cheetares://archive/{digest}" if digest else "cheetares://archive"))
+
+    def toggle_request_log(self, enabled):
+        self.request_recorder.enabled = enabled
+        self.statusBar().showMessage("İstek kaydı " + ("açık" if enabled else "kapalı"), 3000)
+
+    def export_har(self):
+        tab = self.browser
+        url = tab.url()
+        records = self.request_recorder.page_requests(tab.page())
+        if not records:
+            self.statusBar().showMessage("Bu sayfa için kayıtlı istek yok; İstek Kaydı açıkken sayfayı yenileyin", 5000)
+            return
+        file_name = f"{url.host() or 'sayfa'}-{time.strftime('%Y%m%d-%H%M%S')}.har"
+        path, _ = QFileDialog.getSaveFileName(self, "HAR olarak dışa aktar",
+                                              os.path.join(self.download_manager.download_dir, file_name),
+                                              "HAR (*.har)")
+        if not path:
+            return
+        title = tab.title()
+        # Süreler sayfanın Resource Timing verisinden alınır
+        tab.page().runJavaScript(HAR_TIMINGS_JS, QWebEngineScript.ApplicationWorld,
+                                 lambda result: self._write_har(path, records, url.toString(), title, result))
+
+    def _write_har(self, path, records, page_url, title, timings_json):
+        try:
+            timings = json.loads(timings_json) if timings_json else None
+        except ValueError:
+            timings = None
+        har = build_har(records, page_url, title, timings)
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(har, f, ensure_ascii=False, indent=1)
+        except OSError as e:
+            self.statusBar().showMessage(f"HAR yazılamadı: {e}", 5000)
+            return
+        print(f"HAR dışa aktarıldı: {path} ({len(records)} istek)")
+        self.statusBar().showMessage(f"{len(records)} istek HAR olarak kaydedildi: {path}", 5000)
+
+    def _on_page_archived(self, url, digest):
+        if self.browser is not None and self.browser.url().toString() == url:
+            self.statusBar().showMessage("Sayfa çevrimdışı arşive kaydedildi", 3000)
+
+    def total_memory_kb(self):
+        # Tarayıcı süreci + sekmelerin renderer süreçleri (paylaşılan süreç bir kez sayılır)
+        total = _process_rss_kb(os.getpid()) or 0
+        seen = set()
+        for tab in self.tabs():
+            if tab.lifecycle_state() in ("unloaded", "discarded"):
+                continue
+            pid = tab.page().renderProcessPid()
+            if pid and pid not in seen:
+                seen.add(pid)
+                total += _process_rss_kb(pid) or 0
+        return total
+
+    def memory_report(self):
+        rows = []
+        for tab in self.tabs():
+            rows.append((tab.display_title(), tab.lifecycle_state(), tab.memory_kb()))
+        return rows
+
+    def update_tab_tooltips(self):
+        for tab in self.tabs():
+            memory = tab.memory_kb()
+            memory_text = f"{memory / 1024:.1f} MB" if memory else "-"
+            self.tab_widget.setTabToolTip(self.tab_widget.indexOf(tab),
+                                          f"{tab.display_title()}\nDurum: {tab.lifecycle_state()}\nBellek: {memory_text}")
+
+    def show_memory_report(self):
+        self.update_tab_tooltips()
+        lines = []
+        for title, state, memory in self.memory_report():
+            memory_text = f"{memory / 1024:.1f} MB" if memory else "-"
+            lines.append(f"{title[:40]} [{state}]: {memory_text}")
+        # Aynı renderer sürecini paylaşan sekmelerde süreç belleği her sekmede görünür
+        lines.append(f"\nToplam (tarayıcı + renderer süreçleri): {self.total_memory_kb() / 1024:.1f} MB")
+        counts, process_kb = process_summary(process_tree())
+        count_text = ", ".join(f"{kind}: {count}" for kind, count in counts.most_common())
+        lines.append(f"Tüm süreçler ({sum(counts.values())}; {count_text}): {process_kb / 1024:.1f} MB")
+        lines.append("Ayrıntılar: cheetares://processes")
+        report = "\n".join(lines)
+        print(report)
+        QMessageBox.information(self, "Sekme Bellek Kullanımı", report)
 
     def go_home(self):
-        self.browser.setUrl(QUrl.fromLocalFile(self.home_page_path))
-        # HTML sayfasının yüklendiğinden emin olduktan sonra JS çağrısı yapın.
-        # Bu, sayfanın yüklenmesi tamamlandığında tetiklenmeli.
-        # `loadFinished` sinyalini kullanmak daha güvenli olabilir.
-        self.browser.loadFinished.connect(self._on_home_page_load_finished)
-
-    def _on_home_page_load_finished(self, ok):
-        # Sinyal sadece bir kez bağlanmalı, aksi halde her yüklemede tekrar bağlanır.
+        # Tema ve arama motoru, sayfa oluşturulurken enjekte edilen ayar betiğinden okunur.
+        self.browser.setUrl(HOME_URL)
+
+    def page_settings(self):
+        # Ana sayfaya window.cheetaresSettings olarak verilen ayarlar.
+        # 'google', 'duckduckgo' gibi küçük harfli arama motoru değerleri bekleniyor.
+        return {
+            "theme": self.theme_registry.get(self.current_theme)["page_theme"],
+            "searchEngine": self.search_engines[self.current_engine_index][0].lower(),
+        }
+
+    def _settings_script(self):
+        source = f"""
+            if (location.protocol === 'cheetares:') {{
+                window.cheetaresSettings = {json.dumps(self.page_settings())};
+                if (document.documentElement) {{
+                    document.documentElement.className = window.cheetaresSettings.theme;
+                }}
+            }}
+        """
+        return make_user_script("cheetares_settings", source)
+
+    def _install_profile_scripts(self):
+        # Tüm sayfalarda ortak olan betikler profile bir kez eklenir
+        scripts = self.profile.scripts()
+        if not scripts.findScripts("cheetares_perf"):
+            scripts.insert(make_user_script("cheetares_perf", _qwebchannel_js() + PERF_REPORT_JS,
+                                            QWebEngineScript.ApplicationWorld, QWebEngineScript.DocumentReady))
+        if not scripts.findScripts("cheetares_timing_buffer"):
+            scripts.insert(make_user_script("cheetares_timing_buffer", RESOURCE_TIMING_BUFFER_JS,
+                                            QWebEngineScript.ApplicationWorld))
+        if not scripts.findScripts("cheetares_home"):
+            scripts.insert(make_user_script("cheetares_home", _qwebchannel_js() + HOME_PAGE_JS,
+                                            QWebEngineScript.ApplicationWorld, QWebEngineScript.DocumentReady))
+
+    def install_page_scripts(self, page):
+        # Ayarlar DocumentCreation anında enjekte edilir; sayfa ilk çizimde doğru temayla
+        # açılır ve loadFinished sonrası JS çağrısı gerekmez.
+        scripts = page.scripts()
+        for name in ("cheetares_settings", "cheetares_dark_mode"):
+            for script in scripts.findScripts(name):
+                scripts.remove(script)
+        scripts.insert(self._settings_script())
+        if self.web_dark_mode:
+            scripts.insert(make_user_script("cheetares_dark_mode", WEB_DARK_MODE_JS,
+                                            QWebEngineScript.ApplicationWorld))
+
+    def update_page_settings(self):
+        # Ayarlar değiştiğinde bir sonraki yüklemeler için betikler yenilenir
+        for tab in self.tabs():
+            self.install_page_scripts(tab.page())
+        # Önceden yüklenmiş sayfalar eski ayarlarla açıldı
+        self.speculator.clear()
+
+    def toggle_web_dark_mode(self, enabled):
+        self.web_dark_mode = enabled
+        self.update_page_settings()
+        # Açık sayfalara da hemen uygula
+        for tab in self.tabs():
+            if tab.lifecycle_state() != "active" or is_home_url(tab.url()):
+                continue
+            if enabled:
+                tab.page().runJavaScript(WEB_DARK_MODE_JS, QWebEngineScript.ApplicationWorld)
+            else:
+                tab.page().runJavaScript(
+                    "var s = document.getElementById('cheetares-dark-mode'); if (s) s.remove();",
+                    QWebEngineScript.ApplicationWorld)
+
+
+    def _load_completion_sources(self):
+        for _, url in QUICK_LINKS:
+            self.completion_index.add(QUrl(url).host(), visit_count=0, source="quicklink")
         try:
-            self.browser.loadFinished.disconnect(self._on_home_page_load_finished)
-        except TypeError: # Disconnect etmeye çalışırken zaten bağlı değilse hata verir.
-            pass
-        
-        if ok: # Sayfa başarıyla yüklendiyse
-            # HTML sayfasındaki temayı ve arama motorunu Python'dan ayarla
-            self.browser.page().runJavaScript(f"setBrowserTheme('{self.current_theme}');")
-            # HTML'deki select'i güncellemek için JS çağrısı.
-            # 'google', 'duckduckgo' gibi küçük harfli değerler bekleniyor.
-            current_engine_val = self.search_engines[self.current_engine_index][0].lower()
-            self.browser.page().runJavaScript(f"updateSearchEngineSelector('{current_engine_val}');")
+            for host, visit_count, last_visit in self.history.host_stats():
+                self.completion_index.add(host, visit_count, last_visit)
+        except sqlite3.Error as e:
+            print(f"Geçmiş tamamlama için okunamadı: {e}")
+
+    def _update_completions(self, text):
+        suggestions = self.completion_index.complete(text)
+        self.completion_model.setStringList(suggestions)
+        self.speculator.on_omnibox_input(text, suggestions)
+        if suggestions:
+            self.url_completer.complete()
         else:
-            print("Ana sayfa yüklenirken bir hata oluştu.")
+            self.url_completer.popup().hide()
+        # Arama önerileri debounce edilip arka planda istenir, gelince _on_suggestions_ready eklenir
+        if text.strip().startswith(("http://", "https://", "file:", "cheetares:")):
+            self.suggestions.cancel(self.url_bar)
+        else:
+            self.suggestions.request(self.url_bar, self.search_engines[self.current_engine_index][0], text)
+
+    def _on_suggestions_ready(self, owner, text, items):
+        # Servis pencereler arasında paylaşılır; sadece bu pencerenin istekleri işlenir
+        if owner is self.bridge:
+            self.bridge.suggestionsReady.emit(text, items)
+            return
+        if owner is not self.url_bar or text != self.url_bar.text().strip():
+            return
+        hosts = self.completion_index.complete(text)
+        merged = hosts + [item for item in items if item not in hosts]
+        self.completion_model.setStringList(merged[:12])
+        if merged:
+            self.url_completer.complete()
 
+    def _on_completion_activated(self, text):
+        self.url_bar.setText(text)
+        self.navigate_to_url()
 
     def navigate_to_url(self):
-        url_text = self.url_bar.text()
-        if url_text.startswith("file:///"):
+        url_text = self.url_bar.text().strip()
+        self.url_completer.popup().hide()
+        self.suggestions.cancel(self.url_bar)
+        if url_text.startswith(("file:///", "cheetares://")):
             self.browser.setUrl(QUrl(url_text))
+        elif looks_like_address(url_text) or url_text in self.completion_index:
+            # Çıplak alan adı (github.com gibi) arama motoruna gönderilmeden doğrudan açılır
+            self.browser.setUrl(address_url(url_text))
         elif not url_text.startswith("http://") and not url_text.startswith("https://"):
             search_query = self.search_engines[self.current_engine_index][1] + QUrl.toPercentEncoding(url_text).data().decode('utf-8')
             self.browser.setUrl(QUrl(search_query))
@@ -166,138 +3521,96 @@ class WebBrowser(QMainWindow):
             self.browser.setUrl(QUrl(url_text))
 
     def update_url_bar(self, q):
-        # Eğer yüklenen URL bizim yerel HTML sayfamız ise, adres çubuğunu boş bırakabiliriz
-        if q.toLocalFile() == self.home_page_path:
+        # Eğer yüklenen URL bizim ana sayfamız ise, adres çubuğunu boş bırakabiliriz
+        if is_home_url(q):
             self.url_bar.clear()
             self.url_bar.setPlaceholderText("Web adresini girin veya arama yapın...")
         else:
             self.url_bar.setText(q.toString())
         
     def toggle_theme(self):
-        if self.current_theme == "light":
-            self.current_theme = "dark"
-        else:
-            self.current_theme = "light"
+        # Kayıtlı temalar arasında sırayla geçilir (açık, koyu, kullanıcı temaları...)
+        self.current_theme = self.theme_registry.next_name(self.current_theme)
         self.apply_theme() # QSS teması güncellendi
-        # HTML sayfasındaki temayı da güncellemek için JS çağrısı
-        self.browser.page().runJavaScript(f"setBrowserTheme('{self.current_theme}');")
+        self.update_page_settings()
+        # Açık ana sayfa sekmelerindeki temayı da güncellemek için JS çağrısı
+        page_theme = self.theme_registry.get(self.current_theme)["page_theme"]
+        for tab in self.tabs():
+            if is_home_url(tab.url()):
+                tab.page().runJavaScript(f"setBrowserTheme('{page_theme}');")
 
     def apply_theme(self):
-        # Dinamik QSS stilini burada oluşturuyoruz
-        stylesheet = f"""
-            QMainWindow {{ 
-                background-color: {'#1e1e1e' if self.current_theme == 'dark' else '#f0f2f5'}; 
-                color: {'white' if self.current_theme == 'dark' else 'black'}; 
-            }}
-            QToolBar {{ 
-                background-color: {'#2e2e2e' if self.current_theme == 'dark' else '#ffffff'}; 
-                border: none; 
-                border-bottom: 1px solid {'#3a3a3a' if self.current_theme == 'dark' else '#e0e0e0'};
-                padding: 5px;
-            }}
-            QLineEdit {{ 
-                background-color: {'#3e3e3e' if self.current_theme == 'dark' else '#f8f9fa'}; 
-                color: {'white' if self.current_theme == 'dark' else 'black'}; 
-                border: 1px solid {'#555' if self.current_theme == 'dark' else '#ced4da'}; 
-                border-radius: 10px; 
-                padding: 5px 10px; 
-            }}
-            QToolButton {{
-                background-color: {'#4e4e4e' if self.current_theme == 'dark' else '#f8f9fa'}; 
-                color: {'white' if self.current_theme == 'dark' else 'black'};
-                border: 1px solid {'#555' if self.current_theme == 'dark' else '#ced4da'};
-                border-radius: 5px;
-                margin: 2px;
-                padding: 5px 8px 5px 30px; 
-                font-size: 14px;
-                position: relative; 
-            }}
-            QToolButton:hover {{
-                background-color: {'#6a6a6a' if self.current_theme == 'dark' else '#e2e6ea'};
-            }}
-            QToolButton:pressed {{
-                background-color: {'#888888' if self.current_theme == 'dark' else '#dae0e5'};
-            }}
+        # Önceden üretilmiş QSS sadece etkilenen widget'lara uygulanır; QMainWindow'a stil
+        # verilmediği için web görünümleri dahil tüm alt widget'lar yeniden polish edilmez.
+        theme = self.theme_registry.get(self.current_theme)
+        stylesheets = self.theme_registry.stylesheets(self.current_theme)
+        self.navigation_bar.setStyleSheet(stylesheets["toolbar"])
+        self.tab_widget.tabBar().setStyleSheet(stylesheets["tabbar"])
+        self.statusBar().setStyleSheet(stylesheets["statusbar"])
 
-            /* CSS Pseudo-elementleri ile ikonlar */
-            QToolButton#backButton::before {{
-                content: "⬅️"; 
-                position: absolute;
-                left: 8px;
-                top: 50%;
-                transform: translateY(-50%);
-                font-size: 16px;
-                color: {'white' if self.current_theme == 'dark' else 'black'};
-            }}
-            QToolButton#forwardButton::before {{
-                content: "➡️"; 
-                position: absolute;
-                left: 8px;
-                top: 50%;
-                transform: translateY(-50%);
-                font-size: 16px;
-                color: {'white' if self.current_theme == 'dark' else 'black'};
-            }}
-            QToolButton#reloadButton::before {{
-                content: "🔄"; 
-                position: absolute;
-                left: 8px;
-                top: 50%;
-                transform: translateY(-50%);
-                font-size: 16px;
-                color: {'white' if self.current_theme == 'dark' else 'black'};
-            }}
-            QToolButton#homeButton::before {{
-                content: "🏠"; 
-                position: absolute;
-                left: 8px;
-                top: 50%;
-                transform: translateY(-50%);
-                font-size: 16px;
-                color: {'white' if self.current_theme == 'dark' else 'black'};
-            }}
-            QToolButton#themeButton::before {{
-                content: "🌙"; 
-                position: absolute;
-                left: 8px;
-                top: 50%;
-                transform: translateY(-50%);
-                font-size: 16px;
-                color: {'white' if self.current_theme == 'dark' else 'black'};
-            }}
+        palette = self.palette()
+        palette.setColor(QPalette.Window, QColor(theme["colors"]["window_bg"]))
+        palette.setColor(QPalette.WindowText, QColor(theme["colors"]["text"]))
+        self.setPalette(palette)
 
-            QPushButton#searchEngineButton {{
-                background-color: {'#4e4e4e' if self.current_theme == 'dark' else '#007bff'}; 
-                color: {'white' if self.current_theme == 'dark' else 'white'}; 
-                border: none; 
-                border-radius: 5px; 
-                padding: 5px; 
-                margin: 2px;
-                font-size: 14px;
-            }}
-            QPushButton#searchEngineButton:hover {{ 
-                background-color: {'#6a6a6a' if self.current_theme == 'dark' else '#0056b3'}; 
-            }}
-            QPushButton#searchEngineButton:pressed {{
-                background-color: {'#888888' if self.current_theme == 'dark' else '#003e80'};
-            }}
-        """
-        self.setStyleSheet(stylesheet)
-            
     def change_search_engine(self):
         # Arama motoru butonuna tıklandığında Python'daki motoru değiştir.
         self.current_engine_index = (self.current_engine_index + 1) % len(self.search_engines)
         engine_name_text = self.search_engines[self.current_engine_index][0]
         self.search_engine_button.setText(engine_name_text)
-        
-        # Eğer ana sayfadaysak (HTML yüklüyse), HTML'deki select'i de güncelle.
-        if self.browser.url().toLocalFile() == self.home_page_path:
-            current_engine_val = self.search_engines[self.current_engine_index][0].lower()
-            self.browser.page().runJavaScript(f"updateSearchEngineSelector('{current_engine_val}');")
+        self.update_page_settings()
+
+        # Ana sayfa açık olan sekmelerde (HTML yüklüyse), HTML'deki select'i de güncelle.
+        current_engine_val = self.search_engines[self.current_engine_index][0].lower()
+        for tab in self.tabs():
+            if is_home_url(tab.url()):
+                tab.page().runJavaScript(f"updateSearchEngineSelector('{current_engine_val}');")
 
 
 if __name__ == "__main__":
+    # Çalışan bir örnek dosyanın başında, QtWebEngine içe aktarılmadan önce arandı
+    args, launch_urls = LAUNCH
+    server_name = instance_server_name(args.profile)
+    apply_chromium_flags(args)
+    register_internal_scheme()
     app = QApplication(sys.argv)
-    window = WebBrowser()
+    app.setApplicationName("Cheetares")
+    instance_server = None
+    if not args.no_single_instance:
+        # Sunucu ağır kurulumdan önce dinlemeye başlar; bu arada gelen bağlantılar olay döngüsü
+        # başlayınca okunur
+        # Aynı anda başlayan başka bir süreç soketi ilk denetimden sonra almış olabilir; dinlemeden
+        # hemen önce tekrar sorulur ve yanıt veren bir sahip varsa adresler ona devredilir
+        if send_to_running_instance(server_name, launch_urls, args.new_window):
+            sys.exit(0)
+        instance_server = InstanceServer(server_name, app)
+        instance_server.listen()
+    profile = create_profile(args)
+    history = HistoryStore(os.path.join(profile.persistentStoragePath(), "history.sqlite"))
+    app.aboutToQuit.connect(history.close)
+    content_blocker = create_content_blocker(args, profile)
+    request_recorder = RequestRecorder(args.request_log_size, enabled=args.request_log)
+    # İstekler önce kaydediciye, sonra engelleyiciye gider; engellenen istekler de kayıtta görünür
+    interceptors = RequestInterceptorChain(profile)
+    interceptors.add(request_recorder)
+    if content_blocker is not None:
+        interceptors.add(content_blocker)
+    profile.setUrlRequestInterceptor(interceptors)
+    perf_monitor = PerfMonitor(args.perf_buffer, args.perf_log)
+    suggestions = create_suggestion_service(args, profile, history)
+    app.aboutToQuit.connect(suggestions.shutdown)
+    download_manager = DownloadManager(profile, args.download_dir, args.download_segments, args.download_limit)
+    interceptors.add(download_manager)
+    app.aboutToQuit.connect(download_manager.shutdown)
+    page_archive = PageArchive(profile, max_mb=args.archive_size, auto_visits=args.archive_auto)
+    app.aboutToQuit.connect(page_archive.shutdown)
+    window = WebBrowser(profile, history, content_blocker, perf_monitor, download_manager, page_archive,
+                        request_recorder, suggestions, restore_session=not args.no_restore,
+                        speculation={"enabled": not args.no_speculation, "max_prerenders": args.prerender_limit,
+                                     "memory_budget_mb": args.prerender_memory})
+    window.open_urls(launch_urls)
     window.show()
+    if instance_server is not None:
+        instance_server.urlsReceived.connect(window.handle_launch_request)
+        app.aboutToQuit.connect(instance_server.close)
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,404 @@
+# Cheetares için ölçüm betikleri. Qt "offscreen" platformunda, ekran olmadan çalışır.
+#
+#   python benchmark.py theme [--toggles 200]
+#       Tema değiştirmenin maliyeti: eski QMainWindow.setStyleSheet yaklaşımı ile
+#       ThemeRegistry'nin önceden üretilmiş stil sayfaları karşılaştırılır.
+#
+#   python benchmark.py load [--repeat 5] [--output sonuc.json] [--baseline taban.json]
+#       Yerel bir http.server üzerinden sunulan örnek sayfaları (statik, ağır JS, çok resimli)
+#       soğuk ve sıcak önbellekle yükler; loadFinished süresi ve en yüksek RSS kaydedilir.
+#       --baseline ile kayıtlı sonuçlarla karşılaştırılır, gerileme varsa çıkış kodu 1 olur.
+import os
+import sys
+import time
+import json
+import zlib
+import struct
+import shutil
+import argparse
+import tempfile
+import threading
+import statistics
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+import Cheetares
+
+
+def legacy_apply_theme(self):
+    # Tema değişikliğinden önceki WebBrowser.apply_theme: her seferinde büyük bir f-string
+    # üretir ve tüm QMainWindow'a uygular (karşılaştırma için birebir kopya).
+    stylesheet = f"""
+        QMainWindow {{
+            background-color: {'#1e1e1e' if self.current_theme == 'dark' else '#f0f2f5'};
+            color: {'white' if self.current_theme == 'dark' else 'black'};
+        }}
+        QToolBar {{
+            background-color: {'#2e2e2e' if self.current_theme == 'dark' else '#ffffff'};
+            border: none;
+            border-bottom: 1px solid {'#3a3a3a' if self.current_theme == 'dark' else '#e0e0e0'};
+            padding: 5px;
+        }}
+        QLineEdit {{
+            background-color: {'#3e3e3e' if self.current_theme == 'dark' else '#f8f9fa'};
+            color: {'white' if self.current_theme == 'dark' else 'black'};
+            border: 1px solid {'#555' if self.current_theme == 'dark' else '#ced4da'};
+            border-radius: 10px;
+            padding: 5px 10px;
+        }}
+        QToolButton {{
+            background-color: {'#4e4e4e' if self.current_theme == 'dark' else '#f8f9fa'};
+            color: {'white' if self.current_theme == 'dark' else 'black'};
+            border: 1px solid {'#555' if self.current_theme == 'dark' else '#ced4da'};
+            border-radius: 5px;
+            margin: 2px;
+            padding: 5px 8px 5px 30px;
+            font-size: 14px;
+            position: relative;
+        }}
+        QToolButton:hover {{
+            background-color: {'#6a6a6a' if self.current_theme == 'dark' else '#e2e6ea'};
+        }}
+        QToolButton:pressed {{
+            background-color: {'#888888' if self.current_theme == 'dark' else '#dae0e5'};
+        }}
+
+        /* CSS Pseudo-elementleri ile ikonlar */
+        QToolButton#backButton::before {{
+            content: "⬅️";
+            position: absolute;
+            left: 8px;
+            top: 50%;
+            transform: translateY(-50%);
+            font-size: 16px;
+            color: {'white' if self.current_theme == 'dark' else 'black'};
+        }}
+        QToolButton#forwardButton::before {{
+            content: "➡️";
+            position: absolute;
+            left: 8px;
+            top: 50%;
+            transform: translateY(-50%);
+            font-size: 16px;
+            color: {'white' if self.current_theme == 'dark' else 'black'};
+        }}
+        QToolButton#reloadButton::before {{
+            content: "🔄";
+            position: absolute;
+            left: 8px;
+            top: 50%;
+            transform: translateY(-50%);
+            font-size: 16px;
+            color: {'white' if self.current_theme == 'dark' else 'black'};
+        }}
+        QToolButton#homeButton::before {{
+            content: "🏠";
+            position: absolute;
+            left: 8px;
+            top: 50%;
+            transform: translateY(-50%);
+            font-size: 16px;
+            color: {'white' if self.current_theme == 'dark' else 'black'};
+        }}
+        QToolButton#themeButton::before {{
+            content: "🌙";
+            position: absolute;
+            left: 8px;
+            top: 50%;
+            transform: translateY(-50%);
+            font-size: 16px;
+            color: {'white' if self.current_theme == 'dark' else 'black'};
+        }}
+
+        QPushButton#searchEngineButton {{
+            background-color: {'#4e4e4e' if self.current_theme == 'dark' else '#007bff'};
+            color: {'white' if self.current_theme == 'dark' else 'white'};
+            border: none;
+            border-radius: 5px;
+            padding: 5px;
+            margin: 2px;
+            font-size: 14px;
+        }}
+        QPushButton#searchEngineButton:hover {{
+            background-color: {'#6a6a6a' if self.current_theme == 'dark' else '#0056b3'};
+        }}
+        QPushButton#searchEngineButton:pressed {{
+            background-color: {'#888888' if self.current_theme == 'dark' else '#003e80'};
+        }}
+    """
+    self.setStyleSheet(stylesheet)
+
+
+def _time_toggles(app, toggle, count):
+    # Her değişiklikten sonra olay döngüsü işletilir ki yeniden polish ve çizim de ölçülsün
+    durations = []
+    for _ in range(count):
+        started = time.perf_counter()
+        toggle()
+        app.processEvents()
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def _summary(durations):
+    ordered = sorted(durations)
+    return {
+        "mean_ms": statistics.mean(ordered),
+        "p50_ms": ordered[len(ordered) // 2],
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+def create_window(storage_dir, profile_name="benchmark", extra_args=()):
+    # Ölçüm kullanıcının yapılandırma dosyasından etkilenmesin ve verilerine karışmasın:
+    # boş bir yapılandırma verilir, profil verileri geçici dizine yazılır
+    config_path = os.path.join(storage_dir, "config.json")
+    with open(config_path, "w") as f:
+        f.write("{}")
+    profile_args = Cheetares.parse_args(["--config", config_path, "--profile", profile_name, *extra_args])
+    profile = Cheetares.create_profile(profile_args)
+    profile.setPersistentStoragePath(os.path.join(storage_dir, "storage"))
+    window = Cheetares.WebBrowser(profile)
+    window.show()
+    return window
+
+
+def bench_theme(args):
+    storage_dir = tempfile.mkdtemp(prefix="cheetares-bench-")
+    Cheetares.register_internal_scheme()
+    app = QApplication(sys.argv[:1])
+    app.setApplicationName("Cheetares-benchmark")
+    window = create_window(storage_dir, f"bench-{os.getpid()}", ["--cache-type", "memory"])
+    for _ in range(args.tabs - 1):
+        window.add_tab(Cheetares.HOME_URL)
+    app.processEvents()
+
+    def legacy_toggle():
+        window.current_theme = "dark" if window.current_theme == "light" else "light"
+        legacy_apply_theme(window)
+
+    before = _time_toggles(app, legacy_toggle, args.toggles)
+    # Eski yaklaşımın bıraktığı pencere stilini temizleyip yeni yolu ölç
+    window.setStyleSheet("")
+    window.current_theme = "light"
+    app.processEvents()
+    after = _time_toggles(app, window.toggle_theme, args.toggles)
+
+    results = {"before": _summary(before), "after": _summary(after)}
+    print(f"Tema değiştirme ({args.toggles} kez, {args.tabs} sekme):")
+    for label, summary in results.items():
+        print(f"  {label:7s} ort {summary['mean_ms']:.2f} ms  p50 {summary['p50_ms']:.2f} ms  "
+              f"p95 {summary['p95_ms']:.2f} ms")
+    window.history.close()
+    window.close()
+    shutil.rmtree(storage_dir, ignore_errors=True)
+    return results
+
+
+def _png(width, height, rgb):
+    # Tek renkli küçük bir PNG (resim ağırlıklı sayfa için, harici kütüphane gerektirmez)
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+    raw = b"".join(b"\x00" + bytes(rgb) * width for _ in range(height))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+
+def build_fixtures():
+    # yol -> (içerik türü, veri). Sayfalar /<nesil>/ önekiyle istenir; her soğuk ölçümde
+    # yeni bir nesil kullanıldığı için alt kaynaklar da önbellekte bulunmaz.
+    paragraphs = "".join(f"<p>Paragraf {i}: " + "Cheetares hızlı bir tarayıcıdır. " * 20 + "</p>"
+                         for i in range(400))
+    fixtures = {
+        "/static.html": ("text/html", f"<!DOCTYPE html><html><head><title>static</title></head>"
+                                      f"<body>{paragraphs}</body></html>".encode()),
+        "/heavy.js": ("application/javascript", ("var data = [];\n" + "".join(
+            f"function f{i}(x) {{ return x * {i} + Math.sqrt(x + {i}); }}\ndata.push(f{i}({i}));\n"
+            for i in range(20000)) + "var sum = 0; for (var i = 0; i < 3e6; i++) { sum += i % 7; }\n").encode()),
+        "/heavy-js.html": ("text/html", b"<!DOCTYPE html><html><head><title>heavy-js</title>"
+                                        b"<script src='heavy.js'></script></head><body>JS</body></html>"),
+        "/images.html": ("text/html", ("<!DOCTYPE html><html><head><title>images</title></head><body>" + "".join(
+            f"<img src='img/{i}.png' width='64' height='64'>" for i in range(150)) + "</body></html>").encode()),
+    }
+    for i in range(150):
+        fixtures[f"/img/{i}.png"] = ("image/png", _png(64, 64, ((i * 37) % 256, (i * 91) % 256, (i * 13) % 256)))
+    return fixtures
+
+
+PAGES = ("static.html", "heavy-js.html", "images.html")
+
+
+class FixtureServer:
+    def __init__(self):
+        fixtures = build_fixtures()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                _, _, path = self.path.partition("/")[2].partition("/")
+                path = "/" + path.split("?")[0]
+                if path not in fixtures:
+                    self.send_error(404)
+                    return
+                content_type, data = fixtures[path]
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                # Sıcak yüklemeler HTTP önbelleğinden gelebilsin
+                self.send_header("Cache-Control", "public, max-age=3600")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def url(self, generation, page):
+        return f"http://127.0.0.1:{self.server.server_port}/g{generation}/{page}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def navigate_and_wait(app, window, url, driver, timeout_ms):
+    # Gezinme gerçek giriş noktalarından yapılır: adres çubuğu ya da JS köprüsü
+    tab = window.browser
+    loop = QEventLoop()
+    result = {"ok": False, "peak_rss_kb": 0}
+
+    def sample():
+        result["peak_rss_kb"] = max(result["peak_rss_kb"], window.total_memory_kb())
+
+    def finished(ok):
+        result["ok"] = ok
+        loop.quit()
+
+    sampler = QTimer()
+    sampler.timeout.connect(sample)
+    sampler.start(20)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    tab.loadFinished.connect(finished)
+
+    started = time.perf_counter()
+    if driver == "bridge":
+        window.bridge.navigateToUrl(url)
+    else:
+        window.url_bar.setText(url)
+        window.navigate_to_url()
+    loop.exec_()
+    result["finished_ms"] = (time.perf_counter() - started) * 1000
+
+    tab.loadFinished.disconnect(finished)
+    sampler.stop()
+    sample()
+    result["load_ms"] = tab.last_load_ms
+    return result
+
+
+def bench_load(args):
+    storage_dir = tempfile.mkdtemp(prefix="cheetares-bench-")
+    Cheetares.register_internal_scheme()
+    app = QApplication(sys.argv[:1])
+    app.setApplicationName("Cheetares-benchmark")
+    server = FixtureServer()
+    window = create_window(storage_dir, f"bench-{os.getpid()}", ["--cache-dir", os.path.join(storage_dir, "cache")])
+    app.processEvents()
+
+    samples = {}
+    generation = 0
+    try:
+        for page in PAGES:
+            for driver in args.drivers:
+                for _ in range(args.repeat):
+                    generation += 1
+                    url = server.url(generation, page)
+                    for mode in ("cold", "warm"):
+                        # Sıcak ölçüm aynı URL'in ikinci yüklemesidir (önbellek dolu)
+                        result = navigate_and_wait(app, window, url, driver, args.timeout * 1000)
+                        if not result["ok"]:
+                            print(f"Uyarı: {page} ({mode}, {driver}) zamanında yüklenmedi")
+                        key = f"{page}:{mode}:{driver}"
+                        for metric in ("finished_ms", "load_ms", "peak_rss_kb"):
+                            if result[metric] is not None:
+                                samples.setdefault(key, {}).setdefault(metric, []).append(result[metric])
+                        window.browser.setUrl(Cheetares.QUrl("about:blank"))
+                        app.processEvents()
+    finally:
+        server.close()
+        window.history.close()
+        window.close()
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+    results = {key: {metric: statistics.median(values) for metric, values in metrics.items()}
+               for key, metrics in samples.items()}
+    report = {
+        "meta": {"repeat": args.repeat, "python": sys.version.split()[0], "time": time.time()},
+        "results": results,
+    }
+    for key, metrics in sorted(results.items()):
+        print(f"  {key:32s} loadFinished {metrics.get('finished_ms', 0):8.1f} ms  "
+              f"tepe RSS {metrics.get('peak_rss_kb', 0) / 1024:7.1f} MB")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        regressions = compare_with_baseline(report, args.baseline, args.tolerance)
+        if regressions:
+            print("Gerileme bulundu:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print("Taban ölçüme göre gerileme yok.")
+    return report
+
+
+def compare_with_baseline(report, baseline_path, tolerance):
+    # Süreler için hem oransal (tolerance) hem de mutlak (5 ms) eşik aranır ki
+    # çok kısa ölçümlerdeki gürültü gerileme sayılmasın.
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    regressions = []
+    for key, metrics in report["results"].items():
+        for metric, value in metrics.items():
+            base = baseline.get(key, {}).get(metric)
+            if not base:
+                continue
+            minimum_delta = 5 if metric.endswith("_ms") else 10 * 1024
+            if value > base * (1 + tolerance) and value - base > minimum_delta:
+                regressions.append(f"{key} {metric}: {base:.1f} -> {value:.1f} (+{(value / base - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cheetares ölçüm betikleri")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    theme_parser = commands.add_parser("theme", help="Tema değiştirme mikro ölçümü")
+    theme_parser.add_argument("--toggles", type=int, default=200)
+    theme_parser.add_argument("--tabs", type=int, default=3)
+    theme_parser.set_defaults(func=bench_theme)
+
+    load_parser = commands.add_parser("load", help="Sayfa yükleme ölçümü (yerel örnek sunucu ile)")
+    load_parser.add_argument("--repeat", type=int, default=5, help="Her sayfa/sürücü için tekrar sayısı")
+    load_parser.add_argument("--drivers", nargs="+", choices=("url_bar", "bridge"), default=["url_bar", "bridge"])
+    load_parser.add_argument("--timeout", type=int, default=30, help="Bir yükleme için en fazla bekleme (sn)")
+    load_parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    load_parser.add_argument("--baseline", help="Karşılaştırılacak taban sonuç dosyası")
+    load_parser.add_argument("--tolerance", type=float, default=0.15,
+                             help="Gerileme sayılacak oransal artış (0.15 = %%15)")
+    load_parser.set_defaults(func=bench_load)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
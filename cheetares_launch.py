@@ -0,0 +1,306 @@
+# Cheetares'ın açılış kodu: komut satırı, yapılandırma dosyası ve tek örnek soketi.
+# Sadece QtCore ve QtNetwork kullanır; ikinci bir açılış adresleri çalışan tarayıcıya
+# QtWebEngine (ve Chromium) hiç yüklenmeden devredebilsin diye ayrı bir modüldedir.
+import sys
+import os
+import re
+import json
+import argparse
+import getpass
+from PyQt5.QtCore import QUrl, QObject, QStandardPaths, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+
+# Şema yazılmamış ama adres olduğu belli olan girdiler: github.com, localhost:8000/x, 192.168.1.1
+_ADDRESS_RE = re.compile(
+    r"^(localhost|(\d{1,3}\.){3}\d{1,3}|([\w-]+\.)+[^\W\d_]{2,63})(:\d{1,5})?([/?#]\S*)?$")
+
+
+# Yerel sunucular ve IP adresleri genelde TLS'siz çalışır; bunlar http:// ile açılır
+_LOCAL_ADDRESS_RE = re.compile(r"^(localhost|(\d{1,3}\.){3}\d{1,3})([:/?#]|$)", re.IGNORECASE)
+
+
+# Ortak sonek listesinde olmayan ama yerel ağlarda kullanılan üst düzey adlar (RFC 6761, 6762)
+_LOCAL_TLDS = {"local", "localhost", "test", "internal", "lan"}
+
+
+def looks_like_address(text):
+    # Son etiketi gerçek bir üst düzey alan adı olmalı: "node.js" ya da "v1.2" aranır, açılmaz.
+    # Denetim Qt'nin içindeki ortak sonek listesiyle (Public Suffix List) yapılır.
+    match = _ADDRESS_RE.match(text) if " " not in text else None
+    if match is None:
+        return False
+    if _LOCAL_ADDRESS_RE.match(text):
+        return True
+    host = match.group(1)
+    return host.rsplit(".", 1)[1].lower() in _LOCAL_TLDS or bool(QUrl("https://" + host).topLevelDomain())
+
+
+def address_url(text):
+    # Şemasız bir adresi açılacak URL'e çevirir
+    scheme = "http://" if _LOCAL_ADDRESS_RE.match(text) else "https://"
+    return QUrl(scheme + text)
+
+
+def default_config_path():
+    # Chromium ayarları süreç başına tek olduğu için yapılandırma dosyası profilden bağımsızdır
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.GenericConfigLocation),
+                        "cheetares", "config.json")
+
+
+def load_config(path):
+    # Anahtarlar komut satırı seçenekleriyle aynıdır ("cache-dir" ya da "cache_dir" yazılabilir)
+    try:
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Yapılandırma dosyası okunamadı ({path}): {e}")
+        return {}
+    if not isinstance(config, dict):
+        print(f"Yapılandırma dosyası bir JSON nesnesi olmalı: {path}")
+        return {}
+    return {key.replace("-", "_"): value for key, value in config.items()}
+
+
+def _config_value(action, value):
+    # Dosyadaki bir değeri seçeneğin türüne çevirir ve seçeneklerine göre denetler; komut
+    # satırında argparse'ın yaptığı işin aynısı (set_defaults bunları atladığı için)
+    if action.nargs == 0:
+        if not isinstance(value, bool):
+            raise ValueError("true ya da false olmalı")
+        return value
+    if isinstance(action, argparse._AppendAction) or action.nargs in ("*", "+"):
+        items = value if isinstance(value, list) else [value]
+        return [_config_scalar(action, item) for item in items]
+    return _config_scalar(action, value)
+
+
+def _config_scalar(action, value):
+    if isinstance(value, (bool, list, dict)) or value is None:
+        raise ValueError(f"geçersiz değer {value!r}")
+    if action.type is not None:
+        try:
+            value = action.type(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"geçersiz değer {value!r}") from None
+    elif not isinstance(value, str):
+        raise ValueError(f"metin olmalı, {value!r} verildi")
+    if action.choices is not None and value not in action.choices:
+        raise ValueError(f"{value!r} yerine şunlardan biri olmalı: {', '.join(map(str, action.choices))}")
+    return value
+
+
+# QApplication'ın kendi tek tireli seçenekleri; değer alanların değeri sonraki argümandır
+QT_VALUE_OPTIONS = {"-platform", "-platformpluginpath", "-platformtheme", "-plugin", "-qmljsdebugger",
+                    "-qwindowgeometry", "-geometry", "-qwindowtitle", "-title", "-qwindowicon", "-icon",
+                    "-style", "-stylesheet", "-display", "-session", "-name", "-graphicssystem"}
+QT_FLAG_OPTIONS = {"-reverse", "-widgetcount", "-nograb", "-dograb", "-sync", "-visual", "-ncols", "-cmap",
+                   "-testability"}
+
+
+def strip_qt_args(argv):
+    # Qt seçeneklerini ve değerlerini ayıklar; yoksa "-platform offscreen" içindeki "offscreen"
+    # açılacak bir adres sanılır. QApplication yine sys.argv'nin tamamını alır.
+    result = []
+    arguments = iter(argv)
+    for argument in arguments:
+        option = argument.split("=", 1)[0]
+        if option in QT_VALUE_OPTIONS:
+            if "=" not in argument:
+                next(arguments, None)
+            continue
+        if option in QT_FLAG_OPTIONS:
+            continue
+        result.append(argument)
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Cheetares Web Browser")
+    parser.add_argument("urls", nargs="*",
+                        help="Açılacak adresler ya da dosyalar; tarayıcı zaten çalışıyorsa ona iletilir")
+    parser.add_argument("--new-window", action="store_true",
+                        help="Adresleri çalışan tarayıcıda yeni sekme yerine yeni pencerede aç")
+    parser.add_argument("--no-single-instance", action="store_true",
+                        help="Çalışan bir tarayıcı olsa bile bağımsız yeni bir süreç başlat")
+    parser.add_argument("--config", default=None,
+                        help="JSON yapılandırma dosyası; komut satırı değerleri dosyadakileri ezer "
+                             "(varsayılan: ~/.config/cheetares/config.json)")
+    parser.add_argument("--profile", default="default",
+                        help="Kullanılacak kalıcı profil adı (çerezler, önbellek ve veriler profile göre ayrılır)")
+    parser.add_argument("--cache-type", choices=("disk", "memory"), default="disk",
+                        help="HTTP önbelleği diskte mi yoksa sadece bellekte mi tutulsun")
+    parser.add_argument("--cache-dir", default=None,
+                        help="HTTP disk önbelleğinin dizini (varsayılan: profilin önbellek dizini)")
+    parser.add_argument("--cache-size", type=int, default=256,
+                        help="HTTP önbelleğinin en fazla boyutu (MB, 0 = Chromium karar versin)")
+    parser.add_argument("--cookies", choices=("none", "allow", "force"), default="allow",
+                        help="Kalıcı çerez politikası: none = sadece oturum, allow = siteye bırak, force = hepsini kaydet")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Başlarken HTTP önbelleğini temizle (soğuk yükleme ölçümü için)")
+    parser.add_argument("--filter-list", action="append", default=[],
+                        help="EasyList biçiminde reklam/izleyici filtre listesi (birden çok kez verilebilir). "
+                             "Profil dizinindeki filters/*.txt dosyaları da otomatik yüklenir.")
+    parser.add_argument("--no-content-blocker", action="store_true",
+                        help="İçerik engelleyiciyi kapat")
+    parser.add_argument("--perf-buffer", type=int, default=500,
+                        help="Bellekte tutulacak en fazla sayfa yükleme ölçümü")
+    parser.add_argument("--perf-log", default=None,
+                        help="Her sayfa yükleme ölçümünün JSON satırı olarak ekleneceği dosya (JSONL)")
+    parser.add_argument("--no-restore", action="store_true",
+                        help="Önceki oturumu geri yükleme, ana sayfayla başla")
+    parser.add_argument("--download-dir", default=None,
+                        help="İndirmelerin kaydedileceği dizin (varsayılan: sistemin İndirilenler dizini)")
+    parser.add_argument("--download-segments", type=int, default=4,
+                        help="Büyük dosyalar için paralel HTTP Range bağlantısı sayısı")
+    parser.add_argument("--download-limit", type=int, default=0,
+                        help="Toplam indirme hızı sınırı (KB/s, 0 = sınırsız)")
+    parser.add_argument("--suggest-url", action="append", default=[],
+                        help="Arama önerisi arka ucunu değiştir: MOTOR=URL, URL'deki {query} sorguyla "
+                             "değiştirilir (ör. google=http://127.0.0.1:8000/?q={query})")
+    parser.add_argument("--no-suggestions", action="store_true",
+                        help="Arama motorlarından öneri isteme, sadece yerel geçmişi kullan")
+    parser.add_argument("--request-log", action="store_true",
+                        help="İstek kaydını açık başlat (çalışırken araç çubuğundan da açılıp kapatılabilir)")
+    parser.add_argument("--request-log-size", type=int, default=10000,
+                        help="İstek kaydı halka tamponunun kapasitesi (istek sayısı)")
+    parser.add_argument("--archive-size", type=int, default=500,
+                        help="Çevrimdışı sayfa arşivinin en fazla boyutu (MB, sıkıştırılmış)")
+    parser.add_argument("--archive-auto", type=int, default=0,
+                        help="En az bu kadar ziyaret edilen sayfaları otomatik arşivle (0 = kapalı)")
+    parser.add_argument("--no-speculation", action="store_true",
+                        help="Preconnect ve prerender (spekülatif yükleme) kapalı")
+    parser.add_argument("--prerender-limit", type=int, default=1,
+                        help="Aynı anda önceden yüklenen en fazla sayfa (0 = sadece preconnect)")
+    parser.add_argument("--prerender-memory", type=int, default=200,
+                        help="Önceden yüklenen sayfa başına bellek sınırı (MB)")
+    parser.add_argument("--process-model", choices=("process-per-site-instance", "process-per-site"),
+                        default="process-per-site-instance",
+                        help="Chromium süreç modeli: her site örneğine ya da her siteye bir renderer süreci")
+    parser.add_argument("--renderer-process-limit", type=int, default=0,
+                        help="En fazla renderer süreci sayısı (0 = Chromium karar versin)")
+    parser.add_argument("--js-heap-size", type=int, default=0,
+                        help="Renderer başına V8 eski nesil yığın sınırı (MB, 0 = varsayılan)")
+    parser.add_argument("--disable-gpu", action="store_true",
+                        help="GPU'yu kapat, sayfaları yazılımla rasterleştir")
+    parser.add_argument("--chromium-flag", action="append", default=[],
+                        help="Chromium'a olduğu gibi iletilecek ek bayrak (birden çok kez verilebilir)")
+    argv = strip_qt_args(sys.argv[1:] if argv is None else argv)
+    # Önce yalnızca --config okunur; dosyadaki değerler varsayılan olur, komut satırı onları ezer
+    pre_args, _ = parser.parse_known_args(argv)
+    config = load_config(pre_args.config or default_config_path())
+    unknown = sorted(set(config) - set(vars(pre_args)))
+    if unknown:
+        print(f"Yapılandırma dosyasında bilinmeyen anahtarlar yok sayıldı: {', '.join(unknown)}")
+    defaults, invalid = {}, []
+    for action in parser._actions:
+        if action.dest in config and action.dest != "config":
+            try:
+                defaults[action.dest] = _config_value(action, config[action.dest])
+            except ValueError as e:
+                invalid.append(f"{action.dest} ({e})")
+    if invalid:
+        print(f"Yapılandırma dosyasında geçersiz değerler yok sayıldı: {', '.join(invalid)}")
+    parser.set_defaults(**defaults)
+    # Qt'nin kendi argümanlarını (-platform vb.) bozmamak için bilinmeyenleri yok sayıyoruz
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def instance_server_name(profile_name):
+    # Soket adı kullanıcı ve profil başına tekildir; farklı profiller ayrı süreçlerde çalışmaya devam eder
+    return "cheetares-%s-%s" % (getpass.getuser(), re.sub(r"[^\w.-]", "_", profile_name))
+
+
+def resolve_launch_urls(urls):
+    # Göreli dosya yolları bu sürecin çalışma dizinine göre çözülür; çalışan tarayıcı başka bir dizinde olabilir
+    cwd = os.getcwd()
+    resolved = []
+    for text in urls:
+        text = text.strip()
+        if not text:
+            continue
+        # Var olan dosya önce gelir (ör. notlar.md); şemasız adresler adres çubuğundaki gibi
+        # https ile, yerel sunucular http ile açılır. fromUserInput bunları http'ye çevirirdi.
+        if not os.path.exists(os.path.join(cwd, text)) and looks_like_address(text):
+            resolved.append(address_url(text).toString())
+        else:
+            resolved.append(QUrl.fromUserInput(text, cwd).toString())
+    return resolved
+
+
+def send_to_running_instance(name, urls, new_window=False, timeout_ms=500):
+    # Çalışan bir Cheetares varsa adresleri ona iletir ve True döner; yoksa False döner ve bu süreç tarayıcıyı başlatır.
+    # Engelleyici soket çağrıları olay döngüsü gerektirmez, bu yüzden QApplication ve Chromium hiç başlatılmaz.
+    socket = QLocalSocket()
+    socket.connectToServer(name)
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    message = json.dumps({"urls": urls, "new_window": new_window}).encode("utf-8") + b"\n"
+    socket.write(message)
+    socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.UnconnectedState:
+        socket.waitForDisconnected(timeout_ms)
+    return True
+
+
+class InstanceServer(QObject):
+    # Sonraki açılışlardan gelen adresleri dinler; her bağlantı tek satırlık bir JSON mesajı gönderir
+    urlsReceived = pyqtSignal(list, bool)
+
+    def __init__(self, name, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.server = QLocalServer(self)
+        # Soket yalnızca aynı kullanıcının süreçlerine açıktır
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self._on_new_connection)
+
+    def listen(self):
+        # Sadece soketin sahibi yanıt vermiyorsa çağrılmalı: erişim seçenekli listen var olan
+        # soket dosyasının yerine geçer, çöken bir süreçten kalan dosya ise silinebilir
+        if self.server.listen(self.name):
+            return
+        QLocalServer.removeServer(self.name)
+        if not self.server.listen(self.name):
+            print(f"Tek örnek sunucusu başlatılamadı: {self.server.errorString()}")
+
+    def close(self):
+        self.server.close()
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            buffer = bytearray()
+            socket.readyRead.connect(lambda socket=socket, buffer=buffer: self._read(socket, buffer))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _read(self, socket, buffer):
+        buffer.extend(bytes(socket.readAll()))
+        if not buffer.endswith(b"\n"):
+            return
+        socket.disconnectFromServer()
+        try:
+            message = json.loads(bytes(buffer))
+        except ValueError:
+            message = None
+        # Slot içinde yükselen bir istisna Qt tarafından süreci sonlandırır; beklenmeyen her şey atılır
+        if not isinstance(message, dict) or not isinstance(message.get("urls", []), list):
+            print("Tek örnek sunucusu geçersiz bir mesaj aldı")
+            return
+        urls = [url for url in message.get("urls", []) if isinstance(url, str)]
+        self.urlsReceived.emit(urls, bool(message.get("new_window")))
+
+
+def launch_or_forward(argv):
+    # Çalışan bir örnek varsa adresler ona devredilir ve bu süreç hemen çıkar; yoksa
+    # tarayıcıyı başlatacak argümanlar ve adresler döner
+    args = parse_args(argv)
+    launch_urls = resolve_launch_urls(args.urls)
+    if not args.no_single_instance and send_to_running_instance(
+            instance_server_name(args.profile), launch_urls, args.new_window):
+        sys.exit(0)
+    return args, launch_urls